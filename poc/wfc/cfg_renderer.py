@@ -397,6 +397,34 @@ WEATHER_TEMPLATES = {
 }
 
 
+# =============================================================================
+# SECOND PERSON TRANSFORM
+# =============================================================================
+
+# Pronoun fixes (third person -> second person)
+PRONOUN_FIXES = [
+    ("their", "your"), ("them", "you"), ("they", "you"),
+    ("Their", "Your"), ("Them", "You"), ("They", "You"),
+]
+
+# Verb form fixes (third person -> second person)
+VERB_FIXES = [
+    (" goes ", " go "), (" goes.", " go."),
+    (" sets ", " set "), (" sets.", " set."),
+    (" steps ", " step "), (" steps.", " step."),
+    (" feels ", " feel "), (" feels.", " feel."),
+    (" faces ", " face "), (" faces.", " face."),
+    (" prevails", " prevail"), (" stands ", " stand "),
+    (" returns", " return"), (" leaves ", " leave "),
+    (" takes ", " take "), (" receives ", " receive "),
+    (" has ", " have "), ("you has", "you have"),
+    ("You goes", "You go"), ("You sets", "You set"),
+    ("You steps", "You step"), ("You feels", "You feel"),
+    ("You faces", "You face"), ("You stands", "You stand"),
+    ("you's", "your"),
+]
+
+
 # =============================================================================
 # CFG RENDERER CLASS
 # =============================================================================
@@ -449,6 +477,9 @@ class CFGRenderer:
         if genre in GENRE_SLOTS:
             self.slots.update(GENRE_SLOTS[genre])
 
+        # _to_second_person results by (hero name, third-person text)
+        self._second_person_cache: Dict[Tuple[str, str], str] = {}
+
     def set_context(self, **kwargs):
         """Update render context"""
         for key, value in kwargs.items():
@@ -596,41 +627,27 @@ class CFGRenderer:
         return replacement
 
     def _to_second_person(self, text: str) -> str:
-        """Convert third person to second person"""
+        """
+        Convert third person to second person.
+        Results are memoized per (hero name, text): rendered lines come
+        from a fixed set of templates, so most calls are repeats.
+        """
         hero = self.context.hero_name
+        key = (hero, text)
+        cached = self._second_person_cache.get(key)
+        if cached is not None:
+            return cached
 
         # Replace hero references with "you"
         text = text.replace(hero, "you")
         text = text.replace(hero.title(), "You")
 
-        # Fix pronouns
-        text = text.replace("their", "your")
-        text = text.replace("them", "you")
-        text = text.replace("they", "you")
-        text = text.replace("Their", "Your")
-        text = text.replace("Them", "You")
-        text = text.replace("They", "You")
-
-        # Fix verb forms (third person -> second person)
-        verb_fixes = [
-            (" goes ", " go "), (" goes.", " go."),
-            (" sets ", " set "), (" sets.", " set."),
-            (" steps ", " step "), (" steps.", " step."),
-            (" feels ", " feel "), (" feels.", " feel."),
-            (" faces ", " face "), (" faces.", " face."),
-            (" prevails", " prevail"), (" stands ", " stand "),
-            (" returns", " return"), (" leaves ", " leave "),
-            (" takes ", " take "), (" receives ", " receive "),
-            (" has ", " have "), ("you has", "you have"),
-            ("You goes", "You go"), ("You sets", "You set"),
-            ("You steps", "You step"), ("You feels", "You feel"),
-            ("You faces", "You face"), ("You stands", "You stand"),
-            ("you's", "your"),
-        ]
-
-        for old, new in verb_fixes:
+        for old, new in PRONOUN_FIXES:
+            text = text.replace(old, new)
+        for old, new in VERB_FIXES:
             text = text.replace(old, new)
 
+        self._second_person_cache[key] = text
         return text
 
 
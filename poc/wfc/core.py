@@ -8,6 +8,7 @@ Designed to be Z80-portable:
 - Stack-based propagation
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Set, Tuple, Optional, Dict
 from enum import IntEnum
@@ -21,7 +22,7 @@ class WFCState(IntEnum):
     CONTRADICTION = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class WFCCell:
     """Single cell in WFC grid"""
     possibilities: int  # Bitmask of possible tiles
@@ -39,32 +40,44 @@ class WFCCell:
 # Popcount lookup table (256 entries for 8-bit, can extend for wider)
 POPCOUNT_LUT = [bin(i).count('1') for i in range(256)]
 
+# 16-bit tables: popcount and lowest set bit (-1 for 0) of every mask,
+# so a 16-tile possibility mask is decoded with a single index
+POPCOUNT_LUT16 = [POPCOUNT_LUT[i & 0xFF] + POPCOUNT_LUT[i >> 8] for i in range(1 << 16)]
+LOWEST_BIT_LUT16 = [-1] + [(i & -i).bit_length() - 1 for i in range(1, 1 << 16)]
+
+# Entropy of an open cell by 16-bit mask; empty and single-bit masks
+# (contradicted / collapsed cells) map to 17, above any real entropy
+OPEN_ENTROPY_LUT16 = [n if n > 1 else 17 for n in POPCOUNT_LUT16]
+
+
 def popcount(mask: int, bits: int = 32) -> int:
     """Count set bits in mask (Z80-friendly via LUT)"""
+    width = bits // 8 * 8
+    if width <= 16:
+        return POPCOUNT_LUT16[mask & ((1 << width) - 1)]
     count = 0
-    for _ in range(bits // 8):
+    for _ in range(width // 16):
+        count += POPCOUNT_LUT16[mask & 0xFFFF]
+        mask >>= 16
+    if width % 16:
         count += POPCOUNT_LUT[mask & 0xFF]
-        mask >>= 8
     return count
 
 
 def lowest_bit(mask: int) -> int:
     """Get position of lowest set bit"""
-    if mask == 0:
-        return -1
-    pos = 0
-    while (mask & 1) == 0:
-        mask >>= 1
-        pos += 1
-    return pos
+    if mask < 0x10000:
+        return LOWEST_BIT_LUT16[mask]
+    return (mask & -mask).bit_length() - 1
 
 
-def random_set_bit(mask: int, bits: int = 32) -> int:
-    """Choose random set bit from mask"""
+def random_set_bit(mask: int, bits: int = 32,
+                   rng: Optional[random.Random] = None) -> int:
+    """Choose random set bit from mask (rng defaults to the random module)"""
     count = popcount(mask, bits)
     if count == 0:
         return -1
-    target = random.randint(0, count - 1)
+    target = (rng or random).randint(0, count - 1)
     pos = 0
     for i in range(bits):
         if mask & (1 << i):
@@ -95,16 +108,35 @@ class BitwiseWFC:
     constraints_s: Dict[int, int] = field(default_factory=dict)
     constraints_w: Dict[int, int] = field(default_factory=dict)
 
-    # Grid of cells
-    grid: List[List[WFCCell]] = field(default_factory=list)
+    # Cell state, row-major (index = y * width + x): possibility mask per
+    # cell and collapsed tile id (-1 while uncollapsed). Flat int lists keep
+    # the hot loops on plain indexing instead of WFCCell attribute access.
+    possibilities: List[int] = field(default_factory=list)
+    collapsed: List[int] = field(default_factory=list)
 
-    # Propagation stack (Z80: fixed-size array)
-    prop_stack: List[Tuple[int, int]] = field(default_factory=list)
+    # Propagation stack of flat cell indices (Z80: fixed-size array)
+    prop_stack: List[int] = field(default_factory=list)
 
     # Statistics
     iterations: int = 0
     backtracks: int = 0
 
+    # Flat index of the cell behind the last contradiction (-1 = none)
+    contradiction: int = -1
+
+    # Random source for cell choice and collapse (None = module random)
+    rng: Optional[random.Random] = field(default=None, repr=False)
+
+    # Memo: possibilities mask -> allowed neighbor masks (N, E, S, W).
+    # Cleared by reset() and the constraint setters; code that assigns the
+    # constraint dicts directly should do so before generating or call reset().
+    _allowed_cache: Dict[int, Tuple[int, int, int, int]] = field(
+        default_factory=dict, init=False, repr=False)
+
+    # Last to_tile_grid() result; dropped whenever cell state changes
+    _tile_grid_cache: Optional[List[List[int]]] = field(
+        default=None, init=False, repr=False)
+
     def __post_init__(self):
         """Initialize grid with all possibilities"""
         self.reset()
@@ -112,13 +144,26 @@ class BitwiseWFC:
     def reset(self):
         """Reset grid to initial state (all possibilities open)"""
         all_possible = (1 << self.num_tiles) - 1
-        self.grid = [
-            [WFCCell(possibilities=all_possible) for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        size = self.width * self.height
+        self.possibilities = [all_possible] * size
+        self.collapsed = [-1] * size
         self.prop_stack = []
         self.iterations = 0
         self.backtracks = 0
+        self.contradiction = -1
+        self._allowed_cache = {}
+        self._tile_grid_cache = None
+
+    @property
+    def grid(self) -> List[List[WFCCell]]:
+        """Snapshot of the cells as rows of WFCCell (edits are not written back)"""
+        w = self.width
+        poss = self.possibilities
+        tiles = self.collapsed
+        return [
+            [WFCCell(poss[i], tiles[i]) for i in range(row, row + w)]
+            for row in range(0, w * self.height, w)
+        ]
 
     def set_symmetric_constraint(self, tile_a: int, tile_b: int):
         """Set that tile_a and tile_b can be neighbors in any direction"""
@@ -128,6 +173,7 @@ class BitwiseWFC:
             constraints.setdefault(tile_b, 0)
             constraints[tile_a] |= (1 << tile_b)
             constraints[tile_b] |= (1 << tile_a)
+        self._allowed_cache.clear()
 
     def set_directional_constraint(self, tile_from: int, tile_to: int,
                                     direction: str):
@@ -146,6 +192,7 @@ class BitwiseWFC:
         backward.setdefault(tile_to, 0)
         forward[tile_from] |= (1 << tile_to)
         backward[tile_to] |= (1 << tile_from)
+        self._allowed_cache.clear()
 
     def get_allowed_neighbors(self, possibilities: int, direction: str) -> int:
         """
@@ -165,119 +212,278 @@ class BitwiseWFC:
                 allowed |= constraints.get(tile_id, 0)
         return allowed
 
+    def _allowed_masks(self, possibilities: int) -> Tuple[int, int, int, int]:
+        """Allowed neighbor masks in all four directions (memoized)"""
+        masks = self._allowed_cache.get(possibilities)
+        if masks is None:
+            allowed = self.get_allowed_neighbors
+            masks = (allowed(possibilities, 'N'), allowed(possibilities, 'E'),
+                     allowed(possibilities, 'S'), allowed(possibilities, 'W'))
+            self._allowed_cache[possibilities] = masks
+        return masks
+
     def get_entropy(self, x: int, y: int) -> int:
         """Get entropy (number of possibilities) for cell"""
-        cell = self.grid[y][x]
-        if cell.is_collapsed:
+        i = y * self.width + x
+        if self.collapsed[i] >= 0:
             return 0
-        return popcount(cell.possibilities, self.mask_bits)
+        return popcount(self.possibilities[i], self.mask_bits)
 
     def find_min_entropy_cell(self) -> Optional[Tuple[int, int]]:
         """Find uncollapsed cell with minimum entropy (>1)"""
-        min_entropy = self.num_tiles + 1
-        candidates = []
-
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y][x]
-                if cell.is_collapsed or cell.is_contradiction:
-                    continue
-                entropy = popcount(cell.possibilities, self.mask_bits)
-                if entropy == 1:
-                    # Auto-collapse cells with single possibility
-                    return (x, y)
-                if entropy < min_entropy:
-                    min_entropy = entropy
-                    candidates = [(x, y)]
-                elif entropy == min_entropy:
-                    candidates.append((x, y))
-
-        if not candidates:
+        width = self.width
+        possibilities = self.possibilities
+
+        # Whole-grid entropy pass; collapsed and contradicted cells get a
+        # sentinel above any real entropy so min() skips them
+        if 1 < self.num_tiles <= min(self.mask_bits // 8 * 8, 16):
+            # collapse() and propagate() record the tile as soon as a mask
+            # narrows to one bit, so single-bit masks are exactly the
+            # collapsed cells and one table lookup per cell suffices
+            no_choice = OPEN_ENTROPY_LUT16[0]
+            entropies = list(map(OPEN_ENTROPY_LUT16.__getitem__, possibilities))
+        else:
+            no_choice = self.num_tiles + 1
+            mask_bits = self.mask_bits
+            entropies = [
+                popcount(poss, mask_bits) if tile < 0 and poss else no_choice
+                for poss, tile in zip(possibilities, self.collapsed)
+            ]
+
+        min_entropy = min(entropies, default=no_choice)
+        if min_entropy == no_choice:
             return None
-        return random.choice(candidates)
+        if min_entropy == 1:
+            # Auto-collapse cells with single possibility (first in scan order)
+            i = entropies.index(1)
+        else:
+            # Same draw as rng.choice() over the tied cells, but the k-th
+            # tie is found with C-level index() scans instead of a list
+            k = (self.rng or random).randrange(entropies.count(min_entropy))
+            i = entropies.index(min_entropy)
+            for _ in range(k):
+                i = entropies.index(min_entropy, i + 1)
+        return (i % width, i // width)
+
+    def can_place(self, x: int, y: int, tile_id: int) -> bool:
+        """Check whether tile_id is still possible at (x, y)"""
+        return tile_id >= 0 and bool(self.possibilities[y * self.width + x] & (1 << tile_id))
 
     def collapse(self, x: int, y: int, tile_id: Optional[int] = None) -> bool:
         """
         Collapse cell to single tile.
         Returns False if contradiction.
         """
-        cell = self.grid[y][x]
+        i = y * self.width + x
+        poss = self.possibilities[i]
 
         if tile_id is None:
             # Choose random tile from possibilities
-            tile_id = random_set_bit(cell.possibilities, self.mask_bits)
+            tile_id = random_set_bit(poss, self.mask_bits, self.rng)
 
-        if tile_id < 0 or not (cell.possibilities & (1 << tile_id)):
+        if tile_id < 0 or not (poss & (1 << tile_id)):
             return False
 
-        cell.possibilities = 1 << tile_id
-        cell.collapsed_to = tile_id
+        self.possibilities[i] = 1 << tile_id
+        self.collapsed[i] = tile_id
+        self._tile_grid_cache = None
 
         # Add to propagation stack
-        self.prop_stack.append((x, y))
+        self.prop_stack.append(i)
         return True
 
     def propagate(self) -> bool:
         """
         Propagate constraints from collapsed cells.
         Returns False if contradiction detected.
-        """
-        directions = [
-            ('N', 0, -1),
-            ('E', 1, 0),
-            ('S', 0, 1),
-            ('W', -1, 0),
-        ]
-
-        while self.prop_stack:
-            x, y = self.prop_stack.pop()
-            cell = self.grid[y][x]
 
-            for dir_name, dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if not (0 <= nx < self.width and 0 <= ny < self.height):
-                    continue
-
-                neighbor = self.grid[ny][nx]
-                if neighbor.is_collapsed:
-                    continue
-
-                # Get allowed tiles for this direction
-                allowed = self.get_allowed_neighbors(cell.possibilities, dir_name)
-
-                # Constrain neighbor: new = old AND allowed
-                old_poss = neighbor.possibilities
-                new_poss = old_poss & allowed
-
-                if new_poss == 0:
-                    # Contradiction!
-                    return False
-
-                if new_poss != old_poss:
-                    neighbor.possibilities = new_poss
-                    # Check if auto-collapsed
-                    if popcount(new_poss, self.mask_bits) == 1:
-                        neighbor.collapsed_to = lowest_bit(new_poss)
-                    # Add to stack for further propagation
-                    self.prop_stack.append((nx, ny))
+        Directions are unrolled (N, E, S, W) so each neighbor costs a
+        single edge comparison instead of a tuple loop + 2D bounds check.
+        Allowed-neighbor unions come from a per-mask memo, so the tile loop
+        in get_allowed_neighbors runs once per distinct mask, not per edge.
+        A narrowed mask is single-tile when clearing its lowest bit leaves
+        zero (x & (x - 1) == 0); no popcount is needed for that test.
+        """
+        possibilities = self.possibilities
+        tiles = self.collapsed
+        stack = self.prop_stack
+        width = self.width
+        if stack:
+            self._tile_grid_cache = None
+        max_x = width - 1
+        last_row = width * (self.height - 1)
+        cache = self._allowed_cache
+        allowed_masks = self._allowed_masks
+
+        while stack:
+            i = stack.pop()
+            poss = possibilities[i]
+            allow = cache.get(poss)
+            if allow is None:
+                allow = allowed_masks(poss)
+            allow_n, allow_e, allow_s, allow_w = allow
+            x = i % width
+
+            # North
+            if i >= width:
+                j = i - width
+                if tiles[j] < 0:
+                    old_poss = possibilities[j]
+                    new_poss = old_poss & allow_n
+                    if new_poss == 0:
+                        self.contradiction = j
+                        return False
+                    if new_poss != old_poss:
+                        possibilities[j] = new_poss
+                        if not new_poss & (new_poss - 1):
+                            tiles[j] = lowest_bit(new_poss)
+                        stack.append(j)
+
+            # East
+            if x < max_x:
+                j = i + 1
+                if tiles[j] < 0:
+                    old_poss = possibilities[j]
+                    new_poss = old_poss & allow_e
+                    if new_poss == 0:
+                        self.contradiction = j
+                        return False
+                    if new_poss != old_poss:
+                        possibilities[j] = new_poss
+                        if not new_poss & (new_poss - 1):
+                            tiles[j] = lowest_bit(new_poss)
+                        stack.append(j)
+
+            # South
+            if i < last_row:
+                j = i + width
+                if tiles[j] < 0:
+                    old_poss = possibilities[j]
+                    new_poss = old_poss & allow_s
+                    if new_poss == 0:
+                        self.contradiction = j
+                        return False
+                    if new_poss != old_poss:
+                        possibilities[j] = new_poss
+                        if not new_poss & (new_poss - 1):
+                            tiles[j] = lowest_bit(new_poss)
+                        stack.append(j)
+
+            # West
+            if x > 0:
+                j = i - 1
+                if tiles[j] < 0:
+                    old_poss = possibilities[j]
+                    new_poss = old_poss & allow_w
+                    if new_poss == 0:
+                        self.contradiction = j
+                        return False
+                    if new_poss != old_poss:
+                        possibilities[j] = new_poss
+                        if not new_poss & (new_poss - 1):
+                            tiles[j] = lowest_bit(new_poss)
+                        stack.append(j)
 
         return True
 
+    def snapshot(self) -> Tuple[List[int], List[int], List[int], int]:
+        """
+        Copy of the cell state (possibility masks, collapsed tiles), the
+        pending propagation stack and the contradiction cell
+        """
+        return (self.possibilities[:], self.collapsed[:],
+                self.prop_stack[:], self.contradiction)
+
+    def restore(self, state: Tuple[List[int], List[int], List[int], int]):
+        """Put back cell state taken with snapshot()"""
+        possibilities, collapsed, stack, contradiction = state
+        self.possibilities[:] = possibilities
+        self.collapsed[:] = collapsed
+        self.prop_stack = stack[:]
+        self.contradiction = contradiction
+        self._tile_grid_cache = None
+
+    def relax(self, x: int, y: int, radius: int, pinned: Set[int] = frozenset()) -> bool:
+        """
+        Reopen every cell within radius (Chebyshev) of (x, y), except the
+        flat indices in pinned, then re-propagate from the window's boundary
+        ring, the pinned cells and whatever was still on the propagation
+        stack when the last run failed (cells it had narrowed outside the
+        window have not passed that on yet). The rest of the grid keeps its
+        state. Returns False if the window is still contradictory.
+        """
+        width = self.width
+        all_possible = (1 << self.num_tiles) - 1
+        x0, x1 = max(0, x - radius), min(width - 1, x + radius)
+        y0, y1 = max(0, y - radius), min(self.height - 1, y + radius)
+        possibilities = self.possibilities
+        tiles = self.collapsed
+
+        for row in range(y0 * width, (y1 + 1) * width, width):
+            for i in range(row + x0, row + x1 + 1):
+                if i not in pinned:
+                    possibilities[i] = all_possible
+                    tiles[i] = -1
+
+        # Seed propagation with the abandoned stack, the ring just outside
+        # the window (whose masks are unchanged) and the pinned cells in it
+        stack = self.prop_stack
+        stack.extend(i for i in pinned
+                     if x0 <= i % width <= x1 and y0 <= i // width <= y1)
+        for ry in range(y0 - 1, y1 + 2):
+            if not 0 <= ry < self.height:
+                continue
+            row = ry * width
+            if ry in (y0 - 1, y1 + 1):
+                stack.extend(row + rx for rx in range(x0, x1 + 1))
+            else:
+                if x0 > 0:
+                    stack.append(row + x0 - 1)
+                if x1 < width - 1:
+                    stack.append(row + x1 + 1)
+
+        self.contradiction = -1
+        self._tile_grid_cache = None
+        return self.propagate()
+
     def is_complete(self) -> bool:
         """Check if all cells are collapsed"""
-        for row in self.grid:
-            for cell in row:
-                if not cell.is_collapsed:
-                    return False
-        return True
+        return -1 not in self.collapsed
 
     def has_contradiction(self) -> bool:
         """Check if any cell has no possibilities"""
-        for row in self.grid:
-            for cell in row:
-                if cell.is_contradiction:
-                    return True
-        return False
+        tiles = self.collapsed
+        return any(poss == 0 and tiles[i] < 0
+                   for i, poss in enumerate(self.possibilities))
+
+    def is_consistent(self) -> bool:
+        """
+        Check that every pair of collapsed neighbors is allowed by the
+        constraints, both ways (a east of b needs b's E and a's W masks)
+        """
+        width = self.width
+        tiles = self.collapsed
+        size = len(tiles)
+        cons_e, cons_w = self.constraints_e, self.constraints_w
+        cons_s, cons_n = self.constraints_s, self.constraints_n
+
+        for i, a in enumerate(tiles):
+            if a < 0:
+                continue
+            # East
+            if (i + 1) % width:
+                b = tiles[i + 1]
+                if b >= 0 and not ((cons_e.get(a, 0) >> b) & 1
+                                   and (cons_w.get(b, 0) >> a) & 1):
+                    return False
+            # South
+            j = i + width
+            if j < size:
+                b = tiles[j]
+                if b >= 0 and not ((cons_s.get(a, 0) >> b) & 1
+                                   and (cons_n.get(b, 0) >> a) & 1):
+                    return False
+        return True
 
     def generate(self, max_iterations: int = 10000) -> bool:
         """
@@ -291,12 +497,17 @@ class BitwiseWFC:
             cell_pos = self.find_min_entropy_cell()
             if cell_pos is None:
                 # All collapsed or contradiction
-                return self.is_complete()
+                if self.is_complete():
+                    return True
+                # Nothing left to pick but cells remain open: record one
+                self.contradiction = self.collapsed.index(-1)
+                return False
 
             x, y = cell_pos
 
             # Collapse it
             if not self.collapse(x, y):
+                self.contradiction = y * self.width + x
                 return False
 
             # Propagate constraints
@@ -309,30 +520,36 @@ class BitwiseWFC:
         return False
 
     def to_tile_grid(self) -> List[List[int]]:
-        """Convert to simple grid of tile IDs"""
-        return [
-            [cell.collapsed_to for cell in row]
-            for row in self.grid
-        ]
+        """
+        Convert to simple grid of tile IDs.
+        The result is cached until the next reset/collapse/propagate and
+        shared between callers, so treat it as read-only.
+        """
+        if self._tile_grid_cache is None:
+            w = self.width
+            tiles = self.collapsed
+            self._tile_grid_cache = [tiles[i:i + w] for i in range(0, w * self.height, w)]
+        return self._tile_grid_cache
 
     def visualize(self, tile_chars: Dict[int, str]) -> str:
         """Create ASCII visualization"""
-        lines = []
-        for row in self.grid:
-            line = ""
-            for cell in row:
-                if cell.is_collapsed:
-                    line += tile_chars.get(cell.collapsed_to, '?')
-                elif cell.is_contradiction:
-                    line += 'X'
-                else:
-                    entropy = popcount(cell.possibilities, self.mask_bits)
-                    if entropy <= 9:
-                        line += str(entropy)
-                    else:
-                        line += '+'
-            lines.append(line)
-        return '\n'.join(lines)
+        mask_bits = self.mask_bits
+        tiles = self.collapsed
+
+        def cell_char(i: int) -> str:
+            if tiles[i] >= 0:
+                return tile_chars.get(tiles[i], '?')
+            poss = self.possibilities[i]
+            if poss == 0:
+                return 'X'
+            entropy = popcount(poss, mask_bits)
+            return str(entropy) if entropy <= 9 else '+'
+
+        w = self.width
+        return '\n'.join(
+            ''.join(cell_char(i) for i in range(row, row + w))
+            for row in range(0, w * self.height, w)
+        )
 
 
 # =============================================================================
@@ -360,10 +577,10 @@ def find_connected_components(grid: List[List[int]],
 
             # BFS from this cell
             component = set()
-            queue = [(start_x, start_y)]
+            queue = deque([(start_x, start_y)])
 
             while queue:
-                x, y = queue.pop(0)
+                x, y = queue.popleft()
                 if (x, y) in visited:
                     continue
                 if grid[y][x] not in passable:
@@ -373,7 +590,7 @@ def find_connected_components(grid: List[List[int]],
                 component.add((x, y))
 
                 # Add neighbors
-                for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+                for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
                     nx, ny = x + dx, y + dy
                     if 0 <= nx < width and 0 <= ny < height:
                         if (nx, ny) not in visited:
@@ -385,6 +602,57 @@ def find_connected_components(grid: List[List[int]],
     return components
 
 
+def label_components(grid: List[List[int]],
+                     passable: Set[int]) -> Tuple[List[int], List[int]]:
+    """
+    Label connected components of passable tiles in one pass.
+
+    Returns:
+        (labels, sizes): labels is row-major (index y * width + x) holding
+        each cell's region number, -1 for impassable cells; sizes[n] is the
+        cell count of region n. Regions are numbered in the same order as
+        find_connected_components returns them.
+    """
+    height = len(grid)
+    width = len(grid[0]) if height > 0 else 0
+    total = width * height
+
+    labels = [-1 if v in passable else -2 for row in grid for v in row]
+    sizes = []
+
+    for start in range(total):
+        if labels[start] != -1:
+            continue
+
+        # BFS over flat indices; -1 marks passable cells not yet labelled
+        label = len(sizes)
+        labels[start] = label
+        queue = deque([start])
+        size = 0
+
+        while queue:
+            i = queue.popleft()
+            size += 1
+            x = i % width
+
+            if i >= width and labels[i - width] == -1:
+                labels[i - width] = label
+                queue.append(i - width)
+            if x < width - 1 and labels[i + 1] == -1:
+                labels[i + 1] = label
+                queue.append(i + 1)
+            if i + width < total and labels[i + width] == -1:
+                labels[i + width] = label
+                queue.append(i + width)
+            if x > 0 and labels[i - 1] == -1:
+                labels[i - 1] = label
+                queue.append(i - 1)
+
+        sizes.append(size)
+
+    return [max(v, -1) for v in labels], sizes
+
+
 def check_reachability(grid: List[List[int]],
                        start: Tuple[int, int],
                        targets: List[Tuple[int, int]],
@@ -398,12 +666,13 @@ def check_reachability(grid: List[List[int]],
     height = len(grid)
     width = len(grid[0]) if height > 0 else 0
 
-    # BFS from start
+    # BFS from start; stops as soon as every target has been reached
     visited = set()
-    queue = [start]
+    pending = set(targets)
+    queue = deque([start])
 
     while queue:
-        x, y = queue.pop(0)
+        x, y = queue.popleft()
         if (x, y) in visited:
             continue
         if not (0 <= x < width and 0 <= y < height):
@@ -412,8 +681,11 @@ def check_reachability(grid: List[List[int]],
             continue
 
         visited.add((x, y))
+        pending.discard((x, y))
+        if not pending:
+            break
 
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+        for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
             nx, ny = x + dx, y + dy
             if (nx, ny) not in visited:
                 queue.append((nx, ny))
@@ -427,6 +699,51 @@ def check_reachability(grid: List[List[int]],
     return len(unreachable) == 0, unreachable
 
 
+def pack_passable(grid: List[List[int]], passable: Set[int]) -> int:
+    """
+    Pack passable cells into an int bitboard (bit y * width + x set).
+    Lets reachability run as whole-grid shifts instead of per-cell BFS.
+    """
+    digits = ''.join('1' if v in passable else '0'
+                     for row in reversed(grid) for v in reversed(row))
+    return int(digits, 2) if digits else 0
+
+
+def flood_fill(passable: int, width: int, height: int,
+               start: Tuple[int, int], goal: int = 0) -> int:
+    """
+    Bitboard of cells 4-connected to start through passable cells
+    (0 if start is off-grid or blocked). Each step expands the whole
+    frontier at once: N/S are shifts by width, E/W are shifts by one
+    masked so they do not wrap across rows.
+
+    With a goal bitboard, filling stops as soon as every goal cell is
+    reached, so the result is then only guaranteed to cover the goal.
+    """
+    x, y = start
+    if not (0 <= x < width and 0 <= y < height):
+        return 0
+    reached = (passable >> (y * width + x)) & 1
+    if not reached:
+        return 0
+    reached <<= y * width + x
+
+    left_col = 0
+    for row in range(height):
+        left_col |= 1 << (row * width)
+    full = (1 << (width * height)) - 1
+    not_left = full & ~left_col
+    not_right = full & ~(left_col << (width - 1))
+
+    frontier = reached
+    while frontier and (not goal or reached & goal != goal):
+        spread = ((frontier >> width) | (frontier << width) |
+                  ((frontier << 1) & not_left) | ((frontier >> 1) & not_right))
+        frontier = spread & passable & ~reached
+        reached |= frontier
+    return reached
+
+
 def find_path(grid: List[List[int]],
               start: Tuple[int, int],
               goal: Tuple[int, int],
@@ -442,12 +759,12 @@ def find_path(grid: List[List[int]],
         return [start]
 
     visited = {start: None}  # cell -> came_from
-    queue = [start]
+    queue = deque([start])
 
     while queue:
-        x, y = queue.pop(0)
+        x, y = queue.popleft()
 
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+        for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
             nx, ny = x + dx, y + dy
 
             if not (0 <= nx < width and 0 <= ny < height):
@@ -9,14 +9,15 @@ Supports advanced plots with twists and false endings.
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional, Callable
 from enum import Enum, auto
+from array import array
 import random
 import textwrap
 
 from .integration import WorldGenerator, PlotType
-from .geography import TileType, TILE_CHARS, PASSABLE_TILES
-from .plot import ProppFunction, PROPP_NAMES, PlotNode, Requirement, Provides
+from .geography import TileType, TILE_CHARS, PASSABLE_MASK
+from .plot import PROPP_NAMES, PlotNode, Requirement, Provides
 from .plot_advanced import (
-    ProppFunc, TwistType, GENRES,
+    TwistType, GENRES,
     PROPP_NAMES as ADV_PROPP_NAMES
 )
 from .core import find_path
@@ -103,6 +104,104 @@ TILE_DESCRIPTIONS = {
 }
 
 
+# Descriptions keyed by raw tile id (skips enum hashing on every look)
+TILE_DESCRIPTIONS_BY_VALUE = {
+    tile.value: tuple(descs) for tile, descs in TILE_DESCRIPTIONS.items()
+}
+DEFAULT_DESCRIPTIONS = ("You are somewhere.",)
+
+# TileType members by raw tile id (avoids enum construction)
+TILE_TYPES = {t.value: t for t in TileType}
+
+# Tile names by raw tile id (for the landscape status line)
+TILE_NAMES = {t.value: t.name for t in TileType}
+
+# Hint phrase per missing requirement bit (listed lowest bit first)
+MISSING_HINTS = {
+    int(Requirement.HAS_WEAPON): "a weapon",
+    int(Requirement.HAS_KEY): "a key",
+    int(Requirement.HAS_INFO): "knowledge",
+    int(Requirement.HAS_ALLY): "an ally",
+    int(Requirement.VILLAIN_WEAK): "to know the enemy's weakness",
+    int(Requirement.AT_GOAL): "to reach your destination",
+}
+MISSING_HINT_MASK = sum(MISSING_HINTS)
+
+# Exit directions in display order: (name, dx, dy)
+EXIT_DIRECTIONS = (
+    ('north', 0, -1),
+    ('east', 1, 0),
+    ('south', 0, 1),
+    ('west', -1, 0),
+)
+
+# Movement aliases: direction -> (dx, dy, facing)
+MOVE_TABLE = {
+    'n': (0, -1, 'N'), 'north': (0, -1, 'N'),
+    's': (0, 1, 'S'), 'south': (0, 1, 'S'),
+    'e': (1, 0, 'E'), 'east': (1, 0, 'E'),
+    'w': (-1, 0, 'W'), 'west': (-1, 0, 'W'),
+}
+
+# Why a move onto an impassable tile fails
+BLOCKED_MESSAGES = {
+    TileType.RIVER: "The river is too deep to cross here.",
+    TileType.MOUNTAIN: "The mountain is too steep to climb.",
+    TileType.LAKE: "You cannot swim across the lake.",
+    TileType.SWAMP: "The swamp is too dangerous to enter.",
+}
+
+# Function names shared by the simple ProppFunction and advanced ProppFunc
+# enums; nodes are compared by name so both plot kinds take one code path
+START_FUNCTIONS = frozenset(('LACK', 'EQUILIBRIUM'))
+GRANT_FUNCTIONS = frozenset(('ACQUISITION', 'DONOR_TEST'))
+
+
+def function_name(func) -> str:
+    """Canonical name of a plot node function (enum member or other)"""
+    return getattr(func, 'name', None) or str(func)
+
+
+# Rewards for acquisition events: first matching Provides flag wins
+ACQUISITION_GRANTS = (
+    (Provides.HAS_WEAPON, "You receive a mighty weapon!", "magic sword"),
+    (Provides.HAS_KEY, "You obtain a mysterious key!", "ancient key"),
+    (Provides.HAS_ALLY, "A loyal companion joins your quest!", "loyal companion"),
+    (Provides.HAS_INFO, "Ancient wisdom is revealed to you!", None),
+)
+
+# Extra flavour line shown when an event of this function completes
+COMPLETION_FLAVOR = {
+    'EQUILIBRIUM': "Peace reigns... for now.",
+    'LACK': "Your journey begins!",
+    'INTERDICTION': "A warning has been given...",
+    'VIOLATION': "Rules are meant to be broken.",
+    'DEPARTURE': "The road ahead is long, but your heart is determined.",
+    'GUIDANCE': "The path to your goal becomes clear.",
+    'STRUGGLE': "Battle is joined!",
+    'BRANDING': "You bear the mark of your deeds.",
+    'PURSUIT': "They're after you!",
+    'RESCUE': "Someone is saved from peril!",
+    'RECOGNITION': "The truth is revealed!",
+    'PUNISHMENT': "Justice is served.",
+}
+
+# Commands that end the game loop
+QUIT_COMMANDS = frozenset(('quit', 'exit', 'bye'))
+
+# Facing after a 90 degree turn
+TURN_LEFT = {'N': 'W', 'W': 'S', 'S': 'E', 'E': 'N'}
+TURN_RIGHT = {'N': 'E', 'E': 'S', 'S': 'W', 'W': 'N'}
+
+# Byte translation table for map rendering: tile id -> display character,
+# or '?' when MAP_FOG_BIT is set (walkable but not yet visited)
+MAP_FOG_BIT = 0x80
+MAP_CHAR_TABLE = bytes(
+    ord('?') if i & MAP_FOG_BIT else ord(TILE_CHARS.get(i, ' '))
+    for i in range(256)
+)
+
+
 @dataclass
 class GameEngine:
     """
@@ -137,6 +236,9 @@ class GameEngine:
 
     # Output buffer
     output_buffer: List[str] = field(default_factory=list)
+    # Optional sink for headless runs (e.g. sys.stdout.write): when set,
+    # output bypasses the buffer and each chunk is written with a newline
+    output_sink: Optional[Callable[[str], object]] = None
 
     # Landscape renderer
     landscape: LandscapeRenderer = field(default_factory=lambda: LandscapeRenderer(50, 12))
@@ -146,6 +248,66 @@ class GameEngine:
     plot_type: PlotType = PlotType.SIMPLE
     genre_name: str = ""
 
+    # Tile grid snapshot (the world is immutable after initialize)
+    _tile_grid: List[List[int]] = field(default=None, init=False, repr=False)
+    # Same tiles as one row-major byte array (index = y * _grid_w + x)
+    _flat: array = field(default=None, init=False, repr=False)
+    _grid_w: int = field(default=0, init=False, repr=False)
+    _grid_h: int = field(default=0, init=False, repr=False)
+    # Passability bitmap, one bytes row per grid row (1 = walkable)
+    _passable: List[bytes] = field(default_factory=list, init=False, repr=False)
+    # Same bitmap as a single row-major bytes object
+    _passable_flat: bytes = field(default=b"", init=False, repr=False)
+    # Walkable exit names per cell, row-major (passability never changes)
+    _exits: List[Tuple[str, ...]] = field(default_factory=list, init=False, repr=False)
+    # Mirror of `visited` as one row-major bytearray (1 = visited)
+    _visited: bytearray = field(default_factory=bytearray, init=False, repr=False)
+
+    # Plot nodes (flattened once), by id, and position -> node
+    # (first node placed at a position wins)
+    _nodes: List = field(default_factory=list, init=False, repr=False)
+    _node_map: Dict[int, object] = field(default_factory=dict, init=False, repr=False)
+    _pos_to_node: Dict[Tuple[int, int], object] = field(default_factory=dict, init=False, repr=False)
+    # Quest display order (topological sort of the plot, computed once)
+    _plot_order: List[int] = field(default_factory=list, init=False, repr=False)
+    # Function display names matching the plot kind (simple or advanced)
+    _propp_names: Dict = field(default_factory=dict, init=False, repr=False)
+    # Node id -> canonical function name (see function_name)
+    _func_names: Dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    # Shortest paths already found: (start, goal) -> path or None
+    _path_cache: Dict[tuple, Optional[List[Tuple[int, int]]]] = field(default_factory=dict, init=False, repr=False)
+    # Rendered landscape views: (x, y, facing) -> text
+    _view_cache: Dict[Tuple[int, int, str], str] = field(default_factory=dict, init=False, repr=False)
+
+    # Per-engine RNG for flavour text, reseeded from the world seed
+    _rng: random.Random = field(default_factory=random.Random, init=False, repr=False)
+
+    # Command dispatch: alias -> handler (built in __post_init__)
+    _commands: Dict[str, Callable[[], object]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        """Build the command dispatch table"""
+        aliases = [
+            (('n', 'north'), lambda: self.move('north')),
+            (('s', 'south'), lambda: self.move('south')),
+            (('e', 'east'), lambda: self.move('east')),
+            (('w', 'west'), lambda: self.move('west')),
+            (('left', 'turn left', 'tl'), self.turn_left),
+            (('right', 'turn right', 'tr'), self.turn_right),
+            (('l', 'look'), self.describe_location),
+            (('v', 'view', 'landscape'), self.show_landscape),
+            (('do', 'interact', 'action'), self.do_event),
+            (('i', 'inventory', 'inv'), self.show_inventory),
+            (('m', 'map'), self.show_map),
+            (('q', 'quest', 'journal'), self.show_quest),
+            (('h', 'help', '?'), self.show_help),
+        ]
+        self._commands = {
+            alias: handler
+            for names, handler in aliases
+            for alias in names
+        }
+
     def initialize(self, seed: int = None, width: int = 16, height: int = 12,
                    plot_type: PlotType = PlotType.SIMPLE,
                    genre: str = None) -> bool:
@@ -154,12 +316,47 @@ class GameEngine:
             seed = random.randint(0, 999999)
 
         self.world_gen = WorldGenerator(width=width, height=height, seed=seed)
+        self._rng = random.Random(seed)
         self.plot_type = plot_type
         self.genre_name = genre or ""
 
         if not self.world_gen.generate(plot_type=plot_type, genre=genre):
             return False
 
+        self._tile_grid = self.world_gen.geo_gen.wfc.to_tile_grid()
+        self._grid_h = len(self._tile_grid)
+        self._grid_w = len(self._tile_grid[0]) if self._grid_h > 0 else 0
+        self._flat = array('B', [v for row in self._tile_grid for v in row])
+        self._passable = [
+            bytes((PASSABLE_MASK >> v) & 1 for v in row)
+            for row in self._tile_grid
+        ]
+        self._passable_flat = b"".join(self._passable)
+        self._exits = [
+            tuple(name for name, dx, dy in EXIT_DIRECTIONS
+                  if self.can_move_to(x + dx, y + dy))
+            for y in range(self._grid_h)
+            for x in range(self._grid_w)
+        ]
+        self._path_cache = {}
+        self._view_cache = {}
+
+        self._nodes = self.world_gen.world.get_plot_nodes()
+        self._node_map = self.world_gen.world.get_node_map()
+        self._func_names = {n.id: function_name(n.function) for n in self._nodes}
+        self._pos_to_node = {}
+        for node_id, pos in self.world_gen.world.node_locations.items():
+            self._pos_to_node.setdefault(pos, self._node_map.get(node_id))
+
+        world = self.world_gen.world
+        self._propp_names = ADV_PROPP_NAMES if world.advanced_plot else PROPP_NAMES
+        if world.advanced_plot:
+            self._plot_order = world.advanced_plot.topological_sort()
+        elif world.plot:
+            self._plot_order = world.plot.topological_sort()
+        else:
+            self._plot_order = []
+
         # Find starting position (LACK event location or first passable)
         start_pos = self._find_start_position()
         if start_pos:
@@ -168,6 +365,8 @@ class GameEngine:
             return False
 
         self.visited = {(self.player_x, self.player_y)}
+        self._visited = bytearray(self._grid_w * self._grid_h)
+        self._visited[self.player_y * self._grid_w + self.player_x] = 1
         self.inventory = []
         self.completed_events = set()
         self.current_event = None
@@ -185,61 +384,62 @@ class GameEngine:
 
     def _find_start_position(self) -> Optional[Tuple[int, int]]:
         """Find starting position (prefer LACK/EQUILIBRIUM event location)"""
-        # Get nodes from either simple or advanced plot
-        nodes = self.world_gen.world.get_plot_nodes()
-
         # Look for LACK or EQUILIBRIUM event (story beginning)
-        for node in nodes:
-            func = node.function
-            # Check both simple and advanced function types
-            is_start = (func == ProppFunction.LACK if isinstance(func, ProppFunction)
-                       else func in (ProppFunc.LACK, ProppFunc.EQUILIBRIUM))
-            if is_start:
+        for node in self._nodes:
+            if self._func_names[node.id] in START_FUNCTIONS:
                 pos = self.world_gen.world.node_locations.get(node.id)
                 if pos:
                     return pos
 
         # Fallback: find any passable tile
-        grid = self.world_gen.geo_gen.wfc.to_tile_grid()
-        for y in range(len(grid)):
-            for x in range(len(grid[0])):
-                if TileType(grid[y][x]) in PASSABLE_TILES:
-                    return (x, y)
+        i = self._passable_flat.find(1)
+        if i >= 0:
+            return (i % self._grid_w, i // self._grid_w)
 
         return None
 
     def output(self, text: str):
-        """Add text to output buffer"""
-        self.output_buffer.append(text)
+        """Add text to output buffer (or write it straight to output_sink)"""
+        if self.output_sink is not None:
+            self.output_sink(text + '\n')
+        else:
+            self.output_buffer.append(text)
+
+    def output_lines(self, lines: List[str]):
+        """Add several lines at once (one buffer extend or one sink write)"""
+        if self.output_sink is not None:
+            self.output_sink(''.join(line + '\n' for line in lines))
+        else:
+            self.output_buffer.extend(lines)
 
     def get_output(self) -> str:
         """Get and clear output buffer"""
         result = '\n'.join(self.output_buffer)
-        self.output_buffer = []
+        self.output_buffer.clear()
         return result
 
     def get_tile(self, x: int, y: int) -> Optional[TileType]:
         """Get tile type at position"""
-        grid = self.world_gen.geo_gen.wfc.to_tile_grid()
-        if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
-            return TileType(grid[y][x])
+        if 0 <= y < self._grid_h and 0 <= x < self._grid_w:
+            return TILE_TYPES[self._flat[y * self._grid_w + x]]
         return None
 
     def can_move_to(self, x: int, y: int) -> bool:
         """Check if player can move to position"""
-        tile = self.get_tile(x, y)
-        return tile is not None and tile in PASSABLE_TILES
+        w = self._grid_w
+        return 0 <= y < self._grid_h and 0 <= x < w and self._passable_flat[y * w + x] == 1
 
     def describe_location(self):
         """Describe current location"""
-        tile = self.get_tile(self.player_x, self.player_y)
-        if tile is None:
+        x, y = self.player_x, self.player_y
+        if not (0 <= x < self._grid_w and 0 <= y < self._grid_h):
             self.output("You are nowhere.")
             return
+        idx = y * self._grid_w + x
 
-        # Get description
-        descriptions = TILE_DESCRIPTIONS.get(tile, ["You are somewhere."])
-        desc = random.choice(descriptions)
+        # Get description (keyed by raw tile id, no enum round-trip)
+        descriptions = TILE_DESCRIPTIONS_BY_VALUE.get(self._flat[idx], DEFAULT_DESCRIPTIONS)
+        desc = self._rng.choice(descriptions)
         self.output(desc)
 
         # Check for plot events here
@@ -254,70 +454,85 @@ class GameEngine:
             self.output(f"\nExits: {', '.join(exits)}")
 
         # First visit?
-        if (self.player_x, self.player_y) not in self.visited:
-            self.visited.add((self.player_x, self.player_y))
+        if not self._visited[idx]:
+            self._visited[idx] = 1
+            self.visited.add((x, y))
 
     def _get_exits(self) -> List[str]:
         """Get available exit directions"""
-        exits = []
-        directions = [
-            ('north', 0, -1),
-            ('east', 1, 0),
-            ('south', 0, 1),
-            ('west', -1, 0),
-        ]
+        return list(self._exits[self.player_y * self._grid_w + self.player_x])
+
+    def get_path(self, start: Tuple[int, int],
+                 goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Shortest walkable path from start to goal (None if unreachable).
 
-        for name, dx, dy in directions:
-            nx, ny = self.player_x + dx, self.player_y + dy
-            if self.can_move_to(nx, ny):
-                exits.append(name)
+        Results are cached per (start, goal); the world does not change
+        after initialize. The returned list is shared, do not modify it.
+        """
+        key = (start, goal)
+        if key not in self._path_cache:
+            path = self._straight_path(start, goal)
+            if path is None:
+                path = find_path(self._passable, start, goal, {1})
+            self._path_cache[key] = path
+        return self._path_cache[key]
+
+    def _straight_path(self, start: Tuple[int, int],
+                       goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Axis-aligned path if start and goal share a row or column and every
+        cell after start is walkable, else None. Such a line is the unique
+        shortest path, so it matches what find_path would return.
+        """
+        (sx, sy), (gx, gy) = start, goal
+        w, h = self._grid_w, self._grid_h
+        if start == goal or not (0 <= gx < w and 0 <= gy < h):
+            return None
+        if sy == gy:
+            step = 1 if gx > sx else -1
+            cells = [(x, sy) for x in range(sx + step, gx + step, step)]
+        elif sx == gx:
+            step = 1 if gy > sy else -1
+            cells = [(sx, y) for y in range(sy + step, gy + step, step)]
+        else:
+            return None
+        passable = self._passable_flat
+        if all(passable[y * w + x] for x, y in cells):
+            return [start] + cells
+        return None
 
-        return exits
+    def _event_func_name(self, event) -> str:
+        """Canonical function name of an event (cached per node id)"""
+        name = self._func_names.get(event.id)
+        return name if name is not None else function_name(event.function)
 
     def _get_event_at_position(self, x: int, y: int) -> Optional[object]:
         """Get plot event at position (works with both simple and advanced plots)"""
-        nodes = self.world_gen.world.get_plot_nodes()
-        node_map = {n.id: n for n in nodes}
-
-        for node_id, pos in self.world_gen.world.node_locations.items():
-            if pos == (x, y):
-                return node_map.get(node_id)
-        return None
+        return self._pos_to_node.get((x, y))
 
     def move(self, direction: str) -> bool:
         """Move player in direction"""
-        dx, dy = 0, 0
-
-        if direction in ('n', 'north'):
-            dy = -1
-            self.facing = 'N'
-        elif direction in ('s', 'south'):
-            dy = 1
-            self.facing = 'S'
-        elif direction in ('e', 'east'):
-            dx = 1
-            self.facing = 'E'
-        elif direction in ('w', 'west'):
-            dx = -1
-            self.facing = 'W'
-        else:
+        step = MOVE_TABLE.get(direction)
+        if step is None:
             self.output(f"Unknown direction: {direction}")
             return False
+        dx, dy, self.facing = step
 
         nx, ny = self.player_x + dx, self.player_y + dy
 
-        if not self.can_move_to(nx, ny):
-            tile = self.get_tile(nx, ny)
-            if tile == TileType.RIVER:
-                self.output("The river is too deep to cross here.")
-            elif tile == TileType.MOUNTAIN:
-                self.output("The mountain is too steep to climb.")
-            elif tile == TileType.LAKE:
-                self.output("You cannot swim across the lake.")
-            elif tile == TileType.SWAMP:
-                self.output("The swamp is too dangerous to enter.")
-            else:
-                self.output("You cannot go that way.")
+        # Inlined bounds + passability check; the tile is only needed
+        # for the blocked message
+        w = self._grid_w
+        if 0 <= nx < w and 0 <= ny < self._grid_h:
+            idx = ny * w + nx
+            blocked = not self._passable_flat[idx]
+            tile = TILE_TYPES[self._flat[idx]] if blocked else None
+        else:
+            blocked, tile = True, None
+
+        if blocked:
+            self.output(BLOCKED_MESSAGES.get(tile, "You cannot go that way."))
             return False
 
         self.player_x, self.player_y = nx, ny
@@ -341,21 +556,13 @@ class GameEngine:
         req = event.requires
         if req and (req & self.plot_state) != req:
             self.output("You are not yet ready for this challenge.")
-            # Hint at what's needed
-            missing = req & ~self.plot_state
+            # Hint at what's needed: walk the missing bits lowest first
+            missing = int(req) & ~self.plot_state & MISSING_HINT_MASK
             hints = []
-            if missing & Requirement.HAS_WEAPON:
-                hints.append("a weapon")
-            if missing & Requirement.HAS_KEY:
-                hints.append("a key")
-            if missing & Requirement.HAS_INFO:
-                hints.append("knowledge")
-            if missing & Requirement.HAS_ALLY:
-                hints.append("an ally")
-            if missing & Requirement.VILLAIN_WEAK:
-                hints.append("to know the enemy's weakness")
-            if missing & Requirement.AT_GOAL:
-                hints.append("to reach your destination")
+            while missing:
+                bit = missing & -missing
+                hints.append(MISSING_HINTS[bit])
+                missing ^= bit
             if hints:
                 self.output(f"You feel you need: {', '.join(hints)}")
             return False
@@ -368,26 +575,24 @@ class GameEngine:
         self._describe_event_completion(event)
 
         # Handle twist reveals
-        if hasattr(event, 'twist_type') and event.twist_type and event.twist_type != TwistType.NONE:
+        if getattr(event, 'twist_type', TwistType.NONE) != TwistType.NONE:
             self._handle_twist_reveal(event)
 
         # Handle false endings
-        if hasattr(event, 'is_false_ending') and event.is_false_ending:
+        if getattr(event, 'is_false_ending', False):
             self._handle_false_ending(event)
             return True  # Don't check for victory yet
 
         # Check for victory (simple plot or final true victory)
-        func = event.function
-        is_victory = (func == ProppFunction.VICTORY if isinstance(func, ProppFunction)
-                     else func == ProppFunc.VICTORY)
-        is_return = (func == ProppFunction.RETURN if isinstance(func, ProppFunction)
-                    else func == ProppFunc.RETURN)
+        func_name = self._event_func_name(event)
+        is_victory = func_name == 'VICTORY'
+        is_return = func_name == 'RETURN'
 
-        if is_victory or (hasattr(event, 'is_ending') and event.is_ending):
+        if is_victory or getattr(event, 'is_ending', False):
             if not self.in_false_ending:
                 self.output("\n*** VICTORY! Your quest is complete! ***")
                 self.state = GameState.VICTORY
-        elif is_return and hasattr(event, 'is_ending') and event.is_ending:
+        elif is_return and getattr(event, 'is_ending', False):
             self.output("\n*** THE END - Your epic journey is complete! ***")
             self.state = GameState.VICTORY
 
@@ -397,103 +602,58 @@ class GameEngine:
         """Handle a plot twist being revealed"""
         self.twist_revealed = True
 
-        self.output("")
-        self.output("=" * 40)
-        self.output("*** PLOT TWIST! ***")
-        self.output("=" * 40)
+        lines = ["", "=" * 40, "*** PLOT TWIST! ***", "=" * 40]
 
-        if hasattr(event, 'twist_reveals') and event.twist_reveals:
-            self.output(event.twist_reveals)
+        if getattr(event, 'twist_reveals', ''):
+            lines.append(event.twist_reveals)
 
         # Show what's been invalidated
-        if hasattr(event, 'recontextualizes'):
-            for node_id, context in event.recontextualizes.items():
-                self.output(f"  - {context}")
+        recontextualizes = getattr(event, 'recontextualizes', None)
+        if recontextualizes:
+            lines.extend(f"  - {context}" for context in recontextualizes.values())
 
-        self.output("")
-        self.output("The truth changes everything...")
-        self.output("")
+        lines += ["", "The truth changes everything...", ""]
+        self.output_lines(lines)
 
     def _handle_false_ending(self, event):
         """Handle a false ending"""
         self.false_endings_seen += 1
         self.in_false_ending = True
 
-        self.output("")
-        self.output("=" * 40)
-        self.output("*** YOU THINK YOU'VE WON... ***")
-        self.output("=" * 40)
-        self.output("")
+        lines = ["", "=" * 40, "*** YOU THINK YOU'VE WON... ***", "=" * 40, ""]
 
-        if hasattr(event, 'false_ending_reveal') and event.false_ending_reveal:
-            self.output("But wait...")
-            self.output(event.false_ending_reveal)
-            self.output("")
-            self.output("The quest continues!")
+        if getattr(event, 'false_ending_reveal', ''):
+            lines += ["But wait...", event.false_ending_reveal, "", "The quest continues!"]
             self.in_false_ending = False  # Ready for next chapter
 
+        self.output_lines(lines)
+
     def _describe_event_completion(self, event):
         """Describe completing a plot event (handles both simple and advanced functions)"""
         self.output("")
 
         # Use the event's description directly if available
-        if hasattr(event, 'description') and event.description:
+        if getattr(event, 'description', ''):
             self.output(event.description)
 
-        # Get function for comparison
-        func = event.function
-
-        # Check function type (simple ProppFunction or advanced ProppFunc)
-        is_simple = isinstance(func, ProppFunction)
-
-        # Map function names for comparison
-        func_name = func.name if hasattr(func, 'name') else str(func)
+        func_name = self._event_func_name(event)
 
         # Handle inventory for acquisition events
-        if func_name in ('ACQUISITION', 'DONOR_TEST'):
+        if func_name in GRANT_FUNCTIONS:
             provides = event.provides
-            if provides & Provides.HAS_WEAPON:
-                self.output("You receive a mighty weapon!")
-                if "magic sword" not in self.inventory:
-                    self.inventory.append("magic sword")
-            elif provides & Provides.HAS_KEY:
-                self.output("You obtain a mysterious key!")
-                if "ancient key" not in self.inventory:
-                    self.inventory.append("ancient key")
-            elif provides & Provides.HAS_ALLY:
-                self.output("A loyal companion joins your quest!")
-                if "loyal companion" not in self.inventory:
-                    self.inventory.append("loyal companion")
-            elif provides & Provides.HAS_INFO:
-                self.output("Ancient wisdom is revealed to you!")
+            for flag, message, item in ACQUISITION_GRANTS:
+                if provides & flag:
+                    self.output(message)
+                    if item and item not in self.inventory:
+                        self.inventory.append(item)
+                    break
 
         # Additional flavor for specific functions
-        if func_name == 'EQUILIBRIUM':
-            self.output("Peace reigns... for now.")
-        elif func_name == 'LACK':
-            self.output("Your journey begins!")
-        elif func_name == 'INTERDICTION':
-            self.output("A warning has been given...")
-        elif func_name == 'VIOLATION':
-            self.output("Rules are meant to be broken.")
-        elif func_name == 'DEPARTURE':
-            self.output("The road ahead is long, but your heart is determined.")
-        elif func_name == 'GUIDANCE':
-            self.output("The path to your goal becomes clear.")
-        elif func_name == 'STRUGGLE':
-            self.output("Battle is joined!")
-        elif func_name == 'BRANDING':
-            self.output("You bear the mark of your deeds.")
-        elif func_name == 'PURSUIT':
-            self.output("They're after you!")
-        elif func_name == 'RESCUE':
-            self.output("Someone is saved from peril!")
-        elif func_name == 'RECOGNITION':
-            self.output("The truth is revealed!")
-        elif func_name == 'PUNISHMENT':
-            self.output("Justice is served.")
+        flavor = COMPLETION_FLAVOR.get(func_name)
+        if flavor:
+            self.output(flavor)
         elif func_name in ('VICTORY', 'RETURN'):
-            if not (hasattr(event, 'is_false_ending') and event.is_false_ending):
+            if not getattr(event, 'is_false_ending', False):
                 self.output("Peace returns to the land.")
 
         self.output("")
@@ -509,35 +669,35 @@ class GameEngine:
 
     def show_map(self):
         """Show ASCII map with player position"""
-        grid = self.world_gen.geo_gen.wfc.to_tile_grid()
-        height = len(grid)
-        width = len(grid[0]) if height > 0 else 0
+        height = self._grid_h
+        width = self._grid_w
+
+        # Whole-grid masks as big ints, one byte per cell: fog marks walkable
+        # cells not yet visited, shifted into MAP_FOG_BIT and merged with the
+        # tile ids so a single translate yields terrain and fog together.
+        size = width * height
+        passable = int.from_bytes(self._passable_flat, 'big')
+        seen = int.from_bytes(self._visited, 'big')
+        fog = (passable & ~seen) << 7
+        codes = int.from_bytes(self._flat.tobytes(), 'big') | fog
+        cells = bytearray(codes.to_bytes(size, 'big').translate(MAP_CHAR_TABLE))
+
+        # Quest locations and the player are patched on top
+        done, active, player = b"+@*"
+        for (x, y), event in self._pos_to_node.items():
+            if event and event.id in self.completed_events:
+                cells[y * width + x] = done
+            else:
+                cells[y * width + x] = active
 
-        self.output("Map (* = you, @ = quest location, ? = unvisited):")
-        self.output("")
+        cells[self.player_y * width + self.player_x] = player
 
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                if (x, y) == (self.player_x, self.player_y):
-                    line += "*"
-                elif (x, y) in self.world_gen.world.node_locations.values():
-                    # Quest location
-                    event = self._get_event_at_position(x, y)
-                    if event and event.id in self.completed_events:
-                        line += "+"  # Completed
-                    else:
-                        line += "@"  # Active
-                elif (x, y) not in self.visited:
-                    tile = self.get_tile(x, y)
-                    if tile in PASSABLE_TILES:
-                        line += "?"
-                    else:
-                        line += TILE_CHARS.get(tile, ' ')
-                else:
-                    tile = TileType(grid[y][x])
-                    line += TILE_CHARS.get(tile, '?')
-            self.output(line)
+        rows = cells.decode('ascii')
+        self.output_lines([
+            "Map (* = you, @ = quest location, ? = unvisited):",
+            "",
+            *(rows[i:i + width] for i in range(0, size, width)),
+        ])
 
     def show_quest(self):
         """Show quest progress (handles both simple and advanced plots)"""
@@ -548,18 +708,11 @@ class GameEngine:
             self.output(f"Type: {self.plot_type.name}")
         self.output("-" * 30)
 
-        # Get order from appropriate plot
-        if self.world_gen.world.advanced_plot:
-            order = self.world_gen.world.advanced_plot.topological_sort()
-            propp_names = ADV_PROPP_NAMES
-        else:
-            order = self.world_gen.world.plot.topological_sort()
-            propp_names = PROPP_NAMES
-
-        nodes = self.world_gen.world.get_plot_nodes()
-        node_map = {n.id: n for n in nodes}
+        # Order and function names are resolved once at initialize
+        propp_names = self._propp_names
+        node_map = self._node_map
 
-        for node_id in order:
+        for node_id in self._plot_order:
             node = node_map.get(node_id)
             if node is None:
                 continue
@@ -570,44 +723,44 @@ class GameEngine:
 
             # Add markers for special nodes
             markers = ""
-            if hasattr(node, 'is_twist') and node.is_twist:
+            if getattr(node, 'is_twist', False):
                 markers += " [TWIST]"
-            elif hasattr(node, 'twist_type') and node.twist_type and node.twist_type != TwistType.NONE:
+            elif getattr(node, 'twist_type', TwistType.NONE) != TwistType.NONE:
                 markers += " [TWIST]"
-            if hasattr(node, 'is_false_ending') and node.is_false_ending:
+            if getattr(node, 'is_false_ending', False):
                 markers += " [FALSE END]"
-            if hasattr(node, 'is_ending') and node.is_ending:
+            if getattr(node, 'is_ending', False):
                 markers += " [END]"
 
             self.output(f"{status} {func_name}: {desc}...{markers}")
 
     def show_landscape(self):
         """Show Lords of Midnight-style landscape view"""
-        grid = self.world_gen.geo_gen.wfc.to_tile_grid()
-        tile = self.get_tile(self.player_x, self.player_y)
-        location_name = tile.name if tile else "Unknown"
-
-        view = self.landscape.render(
-            grid,
-            self.player_x, self.player_y,
-            self.facing,
-            location_name
-        )
+        # The world is static, so a view depends only on position and facing
+        key = (self.player_x, self.player_y, self.facing)
+        view = self._view_cache.get(key)
+        if view is None:
+            grid = self._tile_grid
+            location_name = TILE_NAMES.get(grid[self.player_y][self.player_x], "Unknown")
+
+            view = self.landscape.render(
+                grid,
+                self.player_x, self.player_y,
+                self.facing,
+                location_name
+            )
+            self._view_cache[key] = view
         self.output(view)
 
     def turn_left(self):
         """Turn 90 degrees left"""
-        dirs = ['N', 'W', 'S', 'E']
-        idx = dirs.index(self.facing) if self.facing in dirs else 0
-        self.facing = dirs[(idx + 1) % 4]
+        self.facing = TURN_LEFT.get(self.facing, 'W')
         self.output(f"You turn to face {self.facing}.")
         self.show_landscape()
 
     def turn_right(self):
         """Turn 90 degrees right"""
-        dirs = ['N', 'E', 'S', 'W']
-        idx = dirs.index(self.facing) if self.facing in dirs else 0
-        self.facing = dirs[(idx + 1) % 4]
+        self.facing = TURN_RIGHT.get(self.facing, 'E')
         self.output(f"You turn to face {self.facing}.")
         self.show_landscape()
 
@@ -638,44 +791,15 @@ Commands:
         if not command:
             return True
 
-        # Movement
-        if command in ('n', 'north'):
-            self.move('north')
-        elif command in ('s', 'south'):
-            self.move('south')
-        elif command in ('e', 'east'):
-            self.move('east')
-        elif command in ('w', 'west'):
-            self.move('west')
-
-        # Turning
-        elif command in ('left', 'turn left', 'tl'):
-            self.turn_left()
-        elif command in ('right', 'turn right', 'tr'):
-            self.turn_right()
-
-        # Actions
-        elif command in ('l', 'look'):
-            self.describe_location()
-        elif command in ('v', 'view', 'landscape'):
-            self.show_landscape()
-        elif command in ('do', 'interact', 'action'):
-            self.do_event()
-        elif command in ('i', 'inventory', 'inv'):
-            self.show_inventory()
-        elif command in ('m', 'map'):
-            self.show_map()
-        elif command in ('q', 'quest', 'journal'):
-            self.show_quest()
-        elif command in ('h', 'help', '?'):
-            self.show_help()
-        elif command in ('quit', 'exit', 'bye'):
+        if command in QUIT_COMMANDS:
             self.output("Farewell, adventurer!")
             return False
 
-        # Unknown
-        else:
+        handler = self._commands.get(command)
+        if handler is None:
             self.output(f"I don't understand '{command}'. Type 'help' for commands.")
+        else:
+            handler()
 
         return True
 
@@ -742,8 +866,7 @@ def play_text_adventure(seed: int = None,
     print(f"Game Over - Turns: {engine.turn_count}")
     print(f"Locations visited: {len(engine.visited)}")
 
-    nodes = engine.world_gen.world.get_plot_nodes()
-    print(f"Events completed: {len(engine.completed_events)}/{len(nodes)}")
+    print(f"Events completed: {len(engine.completed_events)}/{len(engine._nodes)}")
 
     if engine.twist_revealed:
         print("Twist revealed: Yes!")
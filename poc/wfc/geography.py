@@ -5,14 +5,16 @@ Geography Generator using Bitwise WFC
 Designed for non-linear reachability (multiple valid paths allowed).
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Set, Tuple, Dict, Optional
 from enum import IntEnum
 import random
 
 from .core import (
-    BitwiseWFC, WFCCell, popcount,
-    find_connected_components, check_reachability, find_path
+    BitwiseWFC, WFCCell, popcount, lowest_bit,
+    find_connected_components, find_path,
+    pack_passable, flood_fill, label_components
 )
 
 
@@ -73,6 +75,11 @@ PASSABLE_TILES = {
     TileType.DUNGEON,
 }
 
+# Raw tile ids of PASSABLE_TILES, for tests against to_tile_grid() values
+PASSABLE_VALUES = frozenset(t.value for t in PASSABLE_TILES)
+# Same ids as a bit mask: (PASSABLE_MASK >> tile_id) & 1 is 1 if passable
+PASSABLE_MASK = sum(1 << t.value for t in PASSABLE_TILES)
+
 # Impassable tiles (water, mountains, swamp)
 IMPASSABLE_TILES = {
     TileType.RIVER,
@@ -217,15 +224,17 @@ class GeographyGenerator:
         self.height = height
         self.seed = seed
 
-        if seed is not None:
-            random.seed(seed)
+        # Private RNG so generation does not touch (or depend on) the
+        # module-level random state
+        self.rng = random.Random(seed)
 
         # Create WFC engine
         self.wfc = BitwiseWFC(
             width=width,
             height=height,
             num_tiles=16,
-            mask_bits=16
+            mask_bits=16,
+            rng=self.rng
         )
 
         # Load constraints
@@ -238,11 +247,15 @@ class GeographyGenerator:
         # Key locations (set after generation)
         self.key_locations: Dict[str, Tuple[int, int]] = {}
 
+        # pack_passable() of the last tile grid seen, and that grid
+        self._passable_board = 0
+        self._passable_grid: Optional[List[List[int]]] = None
+
     def reset(self, seed: int = None):
         """Reset generator with new seed"""
         if seed is not None:
             self.seed = seed
-            random.seed(seed)
+            self.rng.seed(seed)
         self.wfc.reset()
         self.key_locations = {}
 
@@ -271,14 +284,13 @@ class GeographyGenerator:
 
             all_placed = True
             for name, (x, y) in anchors_copy.items():
-                cell = self.wfc.grid[y][x]
+                possibilities = self.wfc.possibilities[y * self.width + x]
                 # Find a valid tile for this anchor
                 # (simplified: just pick lowest bit from possibilities)
-                if cell.possibilities == 0:
+                if possibilities == 0:
                     all_placed = False
                     break
-                tile = cell.possibilities & -cell.possibilities  # isolate lowest bit
-                tile_id = (tile - 1).bit_length() - 1 if tile > 1 else 0
+                tile_id = lowest_bit(possibilities)
                 if not self.place_anchor(x, y, tile_id, name):
                     all_placed = False
                     break
@@ -296,6 +308,46 @@ class GeographyGenerator:
 
         return False
 
+    @property
+    def last_contradiction(self) -> Optional[Tuple[int, int]]:
+        """(x, y) of the cell the last failed WFC run got stuck on, if any"""
+        i = self.wfc.contradiction
+        if i < 0:
+            return None
+        return (i % self.width, i // self.width)
+
+    def resolve_local(self, cx: int, cy: int, radius: int = 1) -> bool:
+        """
+        Repair a failed generation around (cx, cy) instead of restarting:
+        reopen the cells within radius (key locations stay put), propagate
+        in from the window's edge and finish the WFC run. The repaired map
+        must satisfy every adjacency constraint. On failure the grid is put
+        back as it was, so a caller can retry with a larger radius around
+        the same conflict.
+        """
+        wfc = self.wfc
+        state = wfc.snapshot()
+        width = self.width
+        pinned = {y * width + x for x, y in self.key_locations.values()}
+        if (wfc.relax(cx, cy, radius, pinned) and wfc.generate()
+                and wfc.is_consistent() and self._check_key_reachability()):
+            return True
+        wfc.restore(state)
+        wfc.backtracks += 1
+        return False
+
+    def passable_board(self) -> int:
+        """
+        Passable cells of the current map as a bitboard (bit y * width + x).
+        Packed once per tile grid: to_tile_grid() hands out a new grid
+        whenever cell state changes, so the grid's identity is the key.
+        """
+        grid = self.wfc.to_tile_grid()
+        if grid is not self._passable_grid:
+            self._passable_board = pack_passable(grid, PASSABLE_VALUES)
+            self._passable_grid = grid
+        return self._passable_board
+
     def _check_key_reachability(self) -> bool:
         """
         Check that all key locations are mutually reachable.
@@ -304,33 +356,63 @@ class GeographyGenerator:
         if len(self.key_locations) < 2:
             return True
 
-        grid = self.wfc.to_tile_grid()
-        passable = {t.value for t in PASSABLE_TILES}
-
         # Get all key location positions
         positions = list(self.key_locations.values())
         start = positions[0]
 
-        # Check if all others are reachable from start
-        all_reachable, unreachable = check_reachability(
-            grid, start, positions[1:], passable
-        )
-
-        return all_reachable
+        # Check if all others are reachable from start (bitboard flood
+        # fill that stops once they are all reached)
+        w, h = self.width, self.height
+        goal = 0
+        for x, y in positions[1:]:
+            if not (0 <= x < w and 0 <= y < h):
+                return False
+            goal |= 1 << (y * w + x)
+        reached = flood_fill(self.passable_board(), w, h, start, goal)
+        return reached & goal == goal
 
     def get_connected_regions(self) -> List[Set[Tuple[int, int]]]:
         """Get all connected passable regions"""
         grid = self.wfc.to_tile_grid()
-        passable = {t.value for t in PASSABLE_TILES}
+        passable = PASSABLE_VALUES
         return find_connected_components(grid, passable)
 
+    def get_region_labels(self) -> Tuple[List[int], List[int]]:
+        """
+        Region number per cell, row-major (-1 = impassable), and region
+        sizes; numbering matches get_connected_regions()
+        """
+        return label_components(self.wfc.to_tile_grid(), PASSABLE_VALUES)
+
+    def get_region_masks(self, positions: List[Tuple[int, int]]) -> List[int]:
+        """
+        Bitboard (bit y * width + x) of the passable region holding each
+        position, 0 if it is off-grid or blocked. Only regions that hold a
+        position are flood-filled, each once, so the cost follows the
+        occupied regions rather than a per-cell scan of the whole map.
+        """
+        w, h = self.width, self.height
+        passable = self.passable_board()
+        filled: List[int] = []
+        masks = []
+        for x, y in positions:
+            mask = 0
+            if 0 <= x < w and 0 <= y < h and (passable >> (y * w + x)) & 1:
+                bit = 1 << (y * w + x)
+                mask = next((m for m in filled if m & bit), 0)
+                if not mask:
+                    mask = flood_fill(passable, w, h, (x, y))
+                    filled.append(mask)
+            masks.append(mask)
+        return masks
+
     def find_path_between(self, start_name: str, goal_name: str) -> Optional[List[Tuple[int, int]]]:
         """Find path between two named locations"""
         if start_name not in self.key_locations or goal_name not in self.key_locations:
             return None
 
         grid = self.wfc.to_tile_grid()
-        passable = {t.value for t in PASSABLE_TILES}
+        passable = PASSABLE_VALUES
 
         return find_path(
             grid,
@@ -341,26 +423,23 @@ class GeographyGenerator:
 
     def visualize(self) -> str:
         """Create ASCII map with key locations marked"""
-        base = self.wfc.visualize({t.value: c for t, c in TILE_CHARS.items()})
+        # One character per cell, row-major; TileType keys hash like ints
+        width = self.width
+        cells = list(self.wfc.visualize(TILE_CHARS).replace('\n', ''))
 
         # Mark key locations
-        lines = base.split('\n')
-        for name, (x, y) in self.key_locations.items():
-            if 0 <= y < len(lines) and 0 <= x < len(lines[y]):
-                line = list(lines[y])
-                line[x] = '@'  # Mark key location
-                lines[y] = ''.join(line)
+        for x, y in self.key_locations.values():
+            if 0 <= y < self.height and 0 <= x < width:
+                cells[y * width + x] = '@'
 
-        return '\n'.join(lines)
+        return '\n'.join(
+            ''.join(cells[i:i + width]) for i in range(0, len(cells), width)
+        )
 
     def get_tile_stats(self) -> Dict[TileType, int]:
         """Count tiles of each type"""
-        stats = {t: 0 for t in TileType}
-        for row in self.wfc.grid:
-            for cell in row:
-                if cell.is_collapsed:
-                    stats[TileType(cell.collapsed_to)] += 1
-        return stats
+        counts = Counter(self.wfc.collapsed)  # -1 (uncollapsed) is simply never read
+        return {t: counts[t.value] for t in TileType}
 
 
 # =============================================================================
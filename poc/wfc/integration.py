@@ -9,18 +9,21 @@ Connects plot structure to physical world:
 5. Full completability check
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Set, Tuple, Dict, Optional
+from functools import partial
+from typing import Callable, List, Set, Tuple, Dict, Optional
 from enum import Enum, auto
+import json
 import random
 
-from .core import check_reachability, find_path
+from .core import find_path, flood_fill
 from .geography import (
-    GeographyGenerator, TileType, TILE_CHARS, PASSABLE_TILES
+    GeographyGenerator, TileType, TILE_CHARS
 )
 from .plot import (
     BackwardPlotGenerator, PlotGraph, PlotNode,
-    ProppFunction, PROPP_NAMES, Requirement, Provides
+    ProppFunction, Requirement, Provides
 )
 from .plot_advanced import (
     AdvancedPlotGenerator, MultiPlot, PlotNode as AdvPlotNode,
@@ -67,8 +70,34 @@ LOCATION_TO_TILES = {
     "clearing": [TileType.CLEARING],
 }
 
+# Same choices as raw tile id tuples, plus the fallback for unknown hints,
+# so anchor placement picks straight from a prebuilt sequence
+LOCATION_TILE_IDS = {
+    hint: tuple(int(t) for t in tiles) for hint, tiles in LOCATION_TO_TILES.items()
+}
+DEFAULT_LOCATION_TILE_IDS = (int(TileType.CLEARING),)
+
+# Weather presets matched by substring against the genre name, first hit wins
+GENRE_WEATHER_KEYS = ('dark_fantasy', 'cozy', 'iyashikei', 'mystery',
+                      'solarpunk', 'hopepunk', 'fantasy', 'luminous')
+
+
+def _role_name(role) -> Optional[str]:
+    """Enum name for the cast export, None if unset"""
+    return role.name if role else None
+
 
-@dataclass
+def _transition_export(t) -> Dict:
+    """One role transition as exported by WorldState.to_dict()"""
+    return {
+        "from": t.from_role.name,
+        "to": t.to_role.name,
+        "trigger": t.trigger,
+        "level": _role_name(getattr(t, 'at_level', None))
+    }
+
+
+@dataclass(slots=True)
 class WorldState:
     """Complete generated world state"""
     # Generation results
@@ -104,6 +133,19 @@ class WorldState:
     geo_seed: int = 0
     attempts: int = 0
 
+    # Flattened fractal node list, built on first get_plot_nodes() call
+    # and tied to the fractal_plot it was built from
+    _flat_nodes: List = field(default=None, init=False, repr=False)
+    _flat_nodes_plot: FractalPlot = field(default=None, init=False, repr=False)
+
+    # Node id -> node over get_plot_nodes(), tied to the list it was built from
+    _node_map: Dict = field(default=None, init=False, repr=False)
+    _node_map_nodes: List = field(default=None, init=False, repr=False)
+
+    # verify_completability() result; the world is not changed after
+    # generation, and each generate() starts from a fresh WorldState
+    _completability: Tuple[bool, str] = field(default=None, init=False, repr=False)
+
     def is_valid(self) -> bool:
         has_plot = (self.plot is not None or
                     self.advanced_plot is not None or
@@ -113,14 +155,25 @@ class WorldState:
     def get_plot_nodes(self) -> List:
         """Get plot nodes from simple, advanced, or fractal plot"""
         if self.fractal_plot:
-            # Return flattened nodes from fractal plot
-            return self._flatten_fractal_nodes()
+            # Return flattened nodes from fractal plot (walked once per plot)
+            if self._flat_nodes_plot is not self.fractal_plot:
+                self._flat_nodes = self._flatten_fractal_nodes()
+                self._flat_nodes_plot = self.fractal_plot
+            return self._flat_nodes
         elif self.advanced_plot:
             return self.advanced_plot.nodes
         elif self.plot:
             return self.plot.nodes
         return []
 
+    def get_node_map(self) -> Dict:
+        """Plot nodes by id (built once per node list; treat as read-only)"""
+        nodes = self.get_plot_nodes()
+        if self._node_map_nodes is not nodes:
+            self._node_map = {n.id: n for n in nodes}
+            self._node_map_nodes = nodes
+        return self._node_map
+
     def _flatten_fractal_nodes(self) -> List:
         """Flatten fractal plot nodes for compatibility"""
         if not self.fractal_plot:
@@ -171,26 +224,18 @@ class WorldState:
 
         # Cast
         if self.cast_system:
-            cast_data = {
-                "npcs": {},
+            data["cast"] = {
+                "npcs": {
+                    npc_name: {
+                        "macro_role": _role_name(fractal_role.macro_role),
+                        "meso_role": _role_name(fractal_role.meso_role),
+                        "micro_role": _role_name(fractal_role.micro_role),
+                        "transitions": list(map(_transition_export, fractal_role.transitions))
+                    }
+                    for npc_name, fractal_role in self.cast_system.role_system.npc_roles.items()
+                },
                 "role_transitions": []
             }
-            for npc_name, fractal_role in self.cast_system.role_system.npc_roles.items():
-                cast_data["npcs"][npc_name] = {
-                    "macro_role": fractal_role.macro_role.name if fractal_role.macro_role else None,
-                    "meso_role": fractal_role.meso_role.name if fractal_role.meso_role else None,
-                    "micro_role": fractal_role.micro_role.name if fractal_role.micro_role else None,
-                    "transitions": [
-                        {
-                            "from": t.from_role.name,
-                            "to": t.to_role.name,
-                            "trigger": t.trigger,
-                            "level": t.at_level.name if hasattr(t, 'at_level') and t.at_level else None
-                        }
-                        for t in fractal_role.transitions
-                    ]
-                }
-            data["cast"] = cast_data
 
         # Weather
         if self.weather:
@@ -206,7 +251,6 @@ class WorldState:
 
     def to_json(self, indent: int = 2) -> str:
         """Export complete world state to JSON"""
-        import json
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
 
@@ -222,6 +266,9 @@ class WorldGenerator:
         self.width = width
         self.height = height
         self.base_seed = seed if seed is not None else random.randint(0, 999999)
+        # Private RNG for world-level choices (reseeded per generate());
+        # anchor placement draws from geo_gen.rng, seeded per geo attempt
+        self.rng = random.Random(self.base_seed)
 
         # Legacy simple plot generator
         self.plot_gen = BackwardPlotGenerator()
@@ -268,6 +315,7 @@ class WorldGenerator:
         """
         self.world = WorldState()
         self.world.plot_type = plot_type
+        self.rng.seed(self.base_seed)
 
         # Set genre if specified - handle both string names and Genre objects
         if genre:
@@ -277,18 +325,14 @@ class WorldGenerator:
                 self.world.genre = genre
 
         # Phase 1: Generate plot based on type
-        if plot_type == PlotType.SIMPLE:
-            success = self._generate_simple_plot(max_plot_attempts)
-        elif plot_type == PlotType.FRACTAL:
-            success = self._generate_fractal_plot(
-                max_plot_attempts, narrative_level, fractal_depth,
-                ending_mode, branching, level_complexity,
-                add_twist, add_false_ending
-            )
-        else:
-            success = self._generate_advanced_plot(max_plot_attempts, plot_type, twist_type)
-
-        if not success:
+        generate_plot = self._build_plot_dispatch(
+            plot_type, twist_type,
+            narrative_level=narrative_level, depth=fractal_depth,
+            ending_mode=ending_mode, branching=branching,
+            level_complexity=level_complexity,
+            add_twist=add_twist, add_false_ending=add_false_ending
+        )
+        if not generate_plot(max_plot_attempts):
             return False
 
         # Phase 2: Extract location requirements
@@ -301,17 +345,53 @@ class WorldGenerator:
 
             # Place anchors for plot locations
             if self._place_plot_anchors(required_locations):
-                # Run WFC
-                if self.geo_gen.generate():
+                # Run WFC, repairing a contradiction locally before reseeding
+                if self.geo_gen.generate() or self._resolve_geo_locally():
                     # Verify reachability
                     if self._verify_reachability():
                         self.world.geography = self.geo_gen
                         self.world.geo_seed = geo_seed
                         self.world.attempts = geo_attempt + 1
+
+                        # Phase 4: Cast and weather (fractal plots), only
+                        # once the world is known to be playable
+                        if self.world.fractal_plot:
+                            self._generate_cast()
+                            self._generate_weather()
                         return True
 
         return False
 
+    def _resolve_geo_locally(self) -> bool:
+        """
+        Retry a failed WFC run around its contradiction cell with a growing
+        radius (1, 2, 4, ...) up to the whole map; False means reseed.
+        """
+        conflict = self.geo_gen.last_contradiction
+        if conflict is None:
+            return False
+        cx, cy = conflict
+        radius = 1
+        while radius < max(self.width, self.height):
+            if self.geo_gen.resolve_local(cx, cy, radius):
+                return True
+            radius *= 2
+        return False
+
+    def _build_plot_dispatch(self, plot_type: PlotType, twist_type: TwistType = None,
+                             **fractal_options) -> Callable[[int], bool]:
+        """
+        Plot phase for plot_type, with its options bound, as a callable
+        taking only the attempt budget. fractal_options are the keyword
+        arguments of _generate_fractal_plot and only used for FRACTAL.
+        """
+        if plot_type == PlotType.SIMPLE:
+            return self._generate_simple_plot
+        if plot_type == PlotType.FRACTAL:
+            return partial(self._generate_fractal_plot, **fractal_options)
+        return partial(self._generate_advanced_plot,
+                       plot_type=plot_type, twist_type=twist_type)
+
     def _generate_simple_plot(self, max_attempts: int) -> bool:
         """Generate simple linear plot using legacy generator"""
         for plot_attempt in range(max_attempts):
@@ -417,13 +497,6 @@ class WorldGenerator:
                 self.world.narrative_level = narrative_level
                 self.world.fractal_depth = depth
                 self.world.ending_mode = self.fractal_plot_gen.plot.ending_mode
-
-                # Generate cast and assign roles
-                self._generate_cast()
-
-                # Generate weather
-                self._generate_weather()
-
                 return True
 
         return False
@@ -491,11 +564,11 @@ class WorldGenerator:
             # Dark genres -> higher latitudes (colder, harsher)
             # Tropical genres -> lower latitudes
             if mood == "dark":
-                latitude = random.uniform(50, 65)
+                latitude = self.rng.uniform(50, 65)
             elif mood == "hopeful":
-                latitude = random.uniform(35, 50)
+                latitude = self.rng.uniform(35, 50)
             elif mood == "epic":
-                latitude = random.uniform(40, 55)
+                latitude = self.rng.uniform(40, 55)
 
         # Create weather generator
         self.world.weather_generator = WeatherGenerator(
@@ -508,11 +581,8 @@ class WorldGenerator:
         genre_name = None
         if self.world.genre:
             # Try to match genre name to weather preferences
-            for g_name in ['dark_fantasy', 'cozy', 'iyashikei', 'mystery',
-                          'solarpunk', 'hopepunk', 'fantasy', 'luminous']:
-                if g_name in self.world.genre.name.lower():
-                    genre_name = g_name
-                    break
+            lname = self.world.genre.name.lower()
+            genre_name = next((g for g in GENRE_WEATHER_KEYS if g in lname), None)
 
         if genre_name:
             self.world.weather = create_weather_for_genre(
@@ -525,26 +595,17 @@ class WorldGenerator:
 
     def _get_all_fractal_nodes(self):
         """Get all nodes from fractal plot including nested ones"""
-        nodes = []
-        def collect(plot):
-            for node in plot.nodes:
-                nodes.append(node)
-                if node.has_sub_plot():
-                    collect(node.sub_plot)
         if self.world.fractal_plot:
-            collect(self.world.fractal_plot)
-        return nodes
+            return self.world.get_plot_nodes()
+        return []
 
     def _extract_locations(self) -> Dict[int, str]:
-        """Extract location hints from plot nodes (works with both simple and advanced)"""
-        locations = {}
-        nodes = self.world.get_plot_nodes()
-        for node in nodes:
-            if hasattr(node, 'location_hint') and node.location_hint:
-                locations[node.id] = node.location_hint
-            elif hasattr(node, 'location') and node.location:
-                locations[node.id] = node.location
-        return locations
+        """
+        Extract location hints from plot nodes. Simple, advanced and
+        fractal plot nodes all carry location_hint ("" when unset).
+        """
+        return {node.id: node.location_hint
+                for node in self.world.get_plot_nodes() if node.location_hint}
 
     def _place_plot_anchors(self, required_locations: Dict[int, str]) -> bool:
         """
@@ -562,42 +623,58 @@ class WorldGenerator:
 
         # Assign positions to nodes
         location_list = list(required_locations.items())
-        random.shuffle(location_list)
+        rng = self.geo_gen.rng
+        rng.shuffle(location_list)
 
         self.world.node_locations = {}
+        wfc = self.geo_gen.wfc
+        taken = set()
+
+        # Tile type per node, drawn in one pass (same rng draws, in the
+        # same order, as picking inside the placement loop)
+        choice = rng.choice
+        tile_types = [
+            choice(LOCATION_TILE_IDS.get(loc_hint, DEFAULT_LOCATION_TILE_IDS))
+            for _, loc_hint in location_list
+        ]
 
-        for i, (node_id, loc_hint) in enumerate(location_list):
-            if i >= len(positions):
-                break
-
-            x, y = positions[i]
-
-            # Choose appropriate tile type
-            tile_types = LOCATION_TO_TILES.get(loc_hint, [TileType.CLEARING])
-            tile_type = random.choice(tile_types)
-
-            # Place anchor
-            name = f"plot_{node_id}"
-            if not self.geo_gen.place_anchor(x, y, tile_type, name):
-                # Try adjacent positions if anchor fails
-                placed = False
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < self.width and 0 <= ny < self.height:
-                        if self.geo_gen.place_anchor(nx, ny, tile_type, name):
-                            x, y = nx, ny
-                            placed = True
-                            break
-                if not placed:
+        for (node_id, _), (x, y), tile_type in zip(location_list, positions, tile_types):
+            # Place anchor; if the target cell rules the tile out, fall
+            # back to the nearest free cell that still allows it
+            if (x, y) in taken or not wfc.can_place(x, y, tile_type):
+                nearest = self._nearest_anchor_cell(x, y, tile_type, taken)
+                if nearest is None:
                     return False
+                x, y = nearest
+            if not self.geo_gen.place_anchor(x, y, tile_type, f"plot_{node_id}"):
+                return False
 
+            taken.add((x, y))
             self.world.node_locations[node_id] = (x, y)
 
         return True
 
+    def _nearest_anchor_cell(self, x: int, y: int, tile_type: int,
+                             taken: Set[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """
+        Closest cell (Chebyshev distance, then scan order) whose possibility
+        mask still allows tile_type and that holds no other anchor.
+        """
+        bit = 1 << tile_type
+        width = self.width
+        best, best_dist = None, self.width + self.height
+        for i, poss in enumerate(self.geo_gen.wfc.possibilities):
+            if poss & bit:
+                cy, cx = divmod(i, width)
+                dist = max(abs(cx - x), abs(cy - y))
+                if dist < best_dist and (cx, cy) not in taken:
+                    best, best_dist = (cx, cy), dist
+        return best
+
     def _generate_spread_positions(self, count: int) -> List[Tuple[int, int]]:
         """Generate spread-out positions across map"""
-        positions = []
+        # randrange(lo, hi + 1) is what randint(lo, hi) calls; same draws
+        randrange = self.geo_gen.rng.randrange
 
         # Use grid-based spreading with jitter
         cols = max(2, int(count ** 0.5) + 1)
@@ -606,24 +683,20 @@ class WorldGenerator:
         cell_w = self.width // cols
         cell_h = self.height // rows
 
-        for i in range(count):
-            row = i // cols
-            col = i % cols
-
-            # Center of cell with random jitter
-            base_x = col * cell_w + cell_w // 2
-            base_y = row * cell_h + cell_h // 2
-
-            # Add jitter
-            jitter_x = random.randint(-cell_w // 3, cell_w // 3)
-            jitter_y = random.randint(-cell_h // 3, cell_h // 3)
-
-            x = max(1, min(self.width - 2, base_x + jitter_x))
-            y = max(1, min(self.height - 2, base_y + jitter_y))
-
-            positions.append((x, y))
-
-        return positions
+        # Loop invariants: jitter ranges, clamp bounds and cell centres
+        jx_lo, jx_stop = -cell_w // 3, cell_w // 3 + 1
+        jy_lo, jy_stop = -cell_h // 3, cell_h // 3 + 1
+        max_x, max_y = self.width - 2, self.height - 2
+        centre_x = [col * cell_w + cell_w // 2 for col in range(cols)]
+        centre_y = [row * cell_h + cell_h // 2 for row in range(rows)]
+
+        # Row-major over the first count cells; the tuple draws x before y
+        return [
+            (max(1, min(max_x, centre_x[col] + randrange(jx_lo, jx_stop))),
+             max(1, min(max_y, cy + randrange(jy_lo, jy_stop))))
+            for row, cy in enumerate(centre_y)
+            for col in range(min(cols, count - row * cols))
+        ]
 
     def _verify_reachability(self) -> bool:
         """
@@ -634,17 +707,18 @@ class WorldGenerator:
         if len(self.world.node_locations) < 2:
             return True
 
-        grid = self.geo_gen.wfc.to_tile_grid()
-        passable = {t.value for t in PASSABLE_TILES}
-
-        positions = list(self.world.node_locations.values())
-        start = positions[0]
-
-        all_reachable, unreachable = check_reachability(
-            grid, start, positions[1:], passable
-        )
+        start, *targets = self.world.node_locations.values()
 
-        return all_reachable
+        # One bitboard flood fill from the first location, stopping once
+        # every target is reached; an off-grid target can never be
+        w, h = self.width, self.height
+        goal = 0
+        for x, y in targets:
+            if not (0 <= x < w and 0 <= y < h):
+                return False
+            goal |= 1 << (y * w + x)
+        reached = flood_fill(self.geo_gen.passable_board(), w, h, start, goal)
+        return reached & goal == goal
 
     def verify_completability(self) -> Tuple[bool, str]:
         """
@@ -655,6 +729,12 @@ class WorldGenerator:
         """
         if not self.world.is_valid():
             return False, "World not generated"
+        if self.world._completability is None:
+            self.world._completability = self._check_completability()
+        return self.world._completability
+
+    def _check_completability(self) -> Tuple[bool, str]:
+        """Uncached body of verify_completability() for a generated world"""
 
         # Check plot completability (use appropriate generator)
         if self.world.fractal_plot:
@@ -670,128 +750,123 @@ class WorldGenerator:
             return False, f"Plot: {plot_msg}"
 
         # Check geography connectivity
-        regions = self.geo_gen.get_connected_regions()
-        if len(regions) == 0:
+        if not self.geo_gen.passable_board():
             return False, "No passable regions"
 
-        # Find which region contains plot locations
-        main_region = None
-        for region in regions:
-            positions_in_region = sum(
-                1 for pos in self.world.node_locations.values()
-                if pos in region
-            )
-            if positions_in_region > 0:
-                if main_region is None or len(region) > len(main_region):
-                    main_region = region
+        # Region bitboard of each plot location (0 if off-grid or blocked)
+        node_locations = self.world.node_locations
+        node_regions = dict(zip(
+            node_locations, self.geo_gen.get_region_masks(list(node_locations.values()))
+        ))
 
-        if main_region is None:
+        # Main region: the largest one holding a plot location (the one
+        # with the earliest cell in scan order wins ties)
+        occupied = {region for region in node_regions.values() if region}
+        if not occupied:
             return True, "World is completable (no plot locations)"
+        main_region = min(occupied, key=lambda region: (-region.bit_count(), region & -region))
 
         # Check all plot locations are in same region
-        nodes = self.world.get_plot_nodes()
-        node_map = {n.id: n for n in nodes}
-        for node_id, pos in self.world.node_locations.items():
-            if pos not in main_region:
-                node = node_map.get(node_id)
-                loc_hint = getattr(node, 'location_hint', None) or getattr(node, 'location', 'unknown')
+        for node_id, region in node_regions.items():
+            if region != main_region:
+                node = self.world.get_node_map().get(node_id)
+                loc_hint = getattr(node, 'location_hint', None) or 'unknown'
                 return False, f"Plot location '{loc_hint}' unreachable"
 
         return True, "World is completable"
 
     def get_summary(self) -> str:
         """Get human-readable world summary"""
-        lines = ["=" * 50, "GENERATED WORLD", "=" * 50, ""]
-
         if not self.world.is_valid():
             return "World generation failed"
+        return '\n'.join(self._iter_summary())
+
+    def _iter_summary(self):
+        """Yield get_summary() text a line or multi-line chunk at a time"""
+        world = self.world
+        node_map = world.get_node_map()
+
+        yield "=" * 50
+        yield "GENERATED WORLD"
+        yield "=" * 50
+        yield ""
 
         # Plot type and genre info
-        lines.append(f"Plot Type: {self.world.plot_type.name}")
-        if self.world.genre:
-            lines.append(f"Genre: {self.world.genre.name}")
-        if self.world.has_twist:
-            twist_name = self.world.twist_type.name if self.world.twist_type else "UNKNOWN"
-            lines.append(f"Twist: {twist_name}")
-        if self.world.has_false_ending:
-            lines.append("Has False Ending: Yes")
-        lines.append("")
+        yield f"Plot Type: {world.plot_type.name}"
+        if world.genre:
+            yield f"Genre: {world.genre.name}"
+        if world.has_twist:
+            twist_name = world.twist_type.name if world.twist_type else "UNKNOWN"
+            yield f"Twist: {twist_name}"
+        if world.has_false_ending:
+            yield "Has False Ending: Yes"
+        yield ""
 
         # Plot summary - handle simple, advanced, and fractal
-        lines.append("PLOT STRUCTURE:")
-        lines.append("-" * 30)
+        yield "PLOT STRUCTURE:"
+        yield "-" * 30
 
         # Handle fractal plot separately
-        if self.world.fractal_plot:
+        if world.fractal_plot:
             if self.fractal_plot_gen:
-                lines.append(self.fractal_plot_gen.get_summary())
+                yield self.fractal_plot_gen.get_summary()
             else:
-                lines.append(f"Fractal Plot: {self.world.fractal_plot.get_total_node_count()} nodes")
-                lines.append(f"Max Depth: {self.world.fractal_plot.get_max_depth()}")
-                if self.world.ending_mode:
-                    ending_info = ENDING_MODES.get(self.world.ending_mode, {})
-                    lines.append(f"Ending: {ending_info.get('name', '?')} ({ending_info.get('greek', '')})")
+                yield f"Fractal Plot: {world.fractal_plot.get_total_node_count()} nodes"
+                yield f"Max Depth: {world.fractal_plot.get_max_depth()}"
+                if world.ending_mode:
+                    ending_info = ENDING_MODES.get(world.ending_mode, {})
+                    yield f"Ending: {ending_info.get('name', '?')} ({ending_info.get('greek', '')})"
         else:
-            nodes = self.world.get_plot_nodes()
-            node_map = {n.id: n for n in nodes}
-
             # Get topological order
-            if self.world.advanced_plot:
-                order = self.world.advanced_plot.topological_sort()
-                propp_names = ADV_PROPP_NAMES
-            elif self.world.plot:
-                order = self.world.plot.topological_sort()
-                propp_names = PROPP_NAMES
+            if world.advanced_plot:
+                order = world.advanced_plot.topological_sort()
+            elif world.plot:
+                order = world.plot.topological_sort()
             else:
                 order = []
-                propp_names = PROPP_NAMES
 
             for i, node_id in enumerate(order):
                 node = node_map.get(node_id)
                 if node is None:
                     continue
-                pos = self.world.node_locations.get(node_id, "?")
-                func_name = propp_names.get(node.function, str(node.function))
-                lines.append(f"{i+1}. [{func_name}] @ {pos}")
-                lines.append(f"   {node.description}")
+                pos = world.node_locations.get(node_id, "?")
+                yield f"{i+1}. [{node.name}] @ {pos}\n   {node.description}"
 
                 # Show twist/false ending markers
-                if hasattr(node, 'is_twist') and node.is_twist:
-                    lines.append(f"   ** TWIST POINT **")
-                if hasattr(node, 'is_false_ending') and node.is_false_ending:
-                    lines.append(f"   ** FALSE ENDING **")
-        lines.append("")
+                if getattr(node, 'is_twist', False):
+                    yield "   ** TWIST POINT **"
+                if getattr(node, 'is_false_ending', False):
+                    yield "   ** FALSE ENDING **"
+        yield ""
 
         # Geography
-        lines.append("GEOGRAPHY:")
-        lines.append("-" * 30)
-        lines.append(self.geo_gen.visualize())
-        lines.append("")
+        yield "GEOGRAPHY:"
+        yield "-" * 30
+        yield self.geo_gen.visualize()
+        yield ""
 
         # Key locations
-        lines.append("PLOT LOCATIONS:")
-        if self.world.node_locations:
-            all_nodes = self.world.get_plot_nodes()
-            all_node_map = {n.id: n for n in all_nodes}
-            for node_id, pos in self.world.node_locations.items():
-                node = all_node_map.get(node_id)
-                if node is None:
-                    lines.append(f"  Node {node_id}: {pos}")
-                else:
-                    func_name = ADV_PROPP_NAMES.get(node.function, str(node.function))
-                    loc_hint = getattr(node, 'location_hint', None) or getattr(node, 'location', 'unknown')
-                    lines.append(f"  {func_name}: {pos} ({loc_hint})")
-        lines.append("")
+        yield "PLOT LOCATIONS:"
+        for node_id, pos in world.node_locations.items():
+            node = node_map.get(node_id)
+            if node is None:
+                yield f"  Node {node_id}: {pos}"
+            else:
+                # Looked up in the advanced table even for simple plots
+                # (whose ProppFunction ids map to other names there), as
+                # the summary always has; node.name would change its text
+                func_name = ADV_PROPP_NAMES.get(node.function, str(node.function))
+                loc_hint = node.location_hint or 'unknown'
+                yield f"  {func_name}: {pos} ({loc_hint})"
+        yield ""
 
         # Stats
-        lines.append(f"Seeds: plot={self.world.plot_seed}, geo={self.world.geo_seed}")
-        lines.append(f"Generation attempts: {self.world.attempts}")
+        yield f"Seeds: plot={world.plot_seed}, geo={world.geo_seed}"
+        yield f"Generation attempts: {world.attempts}"
 
         # Verify
         valid, msg = self.verify_completability()
-        lines.append(f"Completability: {msg}")
-
-        return '\n'.join(lines)
+        yield f"Completability: {msg}"
 
     def get_playable_order(self) -> List[Tuple[int, object, Tuple[int, int]]]:
         """
@@ -806,35 +881,51 @@ class WorldGenerator:
         # Get order from appropriate plot
         if self.world.advanced_plot:
             order = self.world.advanced_plot.topological_sort()
-            nodes = self.world.advanced_plot.nodes
         else:
             order = self.world.plot.topological_sort()
-            nodes = self.world.plot.nodes
-
-        node_map = {n.id: n for n in nodes}
-        result = []
-
-        for node_id in order:
-            node = node_map.get(node_id)
-            if node:
-                pos = self.world.node_locations.get(node_id)
-                result.append((node_id, node, pos))
 
-        return result
+        # The order is cached on the plot and the node map on the world
+        node_map = self.world.get_node_map()
+        location_of = self.world.node_locations.get
+        return [(node_id, node, location_of(node_id))
+                for node_id in order
+                if (node := node_map.get(node_id))]
 
     def get_twist_nodes(self) -> List[Tuple[int, object]]:
         """Get nodes that are twist points"""
         if not self.world.advanced_plot:
             return []
-        return [(n.id, n) for n in self.world.advanced_plot.nodes
-                if hasattr(n, 'is_twist') and n.is_twist]
+        return [(n.id, n) for n in self.world.advanced_plot.get_twist_nodes()]
 
     def get_false_ending_nodes(self) -> List[Tuple[int, object]]:
         """Get nodes that are false endings"""
         if not self.world.advanced_plot:
             return []
-        return [(n.id, n) for n in self.world.advanced_plot.nodes
-                if hasattr(n, 'is_false_ending') and n.is_false_ending]
+        return [(n.id, n) for n in self.world.advanced_plot.get_false_ending_nodes()]
+
+    @classmethod
+    def generate_batch(cls, count: int, width: int = 16, height: int = 12,
+                       base_seed: int = 0, workers: int = None,
+                       **generate_kwargs) -> List[Optional[WorldState]]:
+        """
+        Generate `count` worlds with seeds base_seed .. base_seed + count - 1
+        in parallel worker processes (generation is CPU-bound pure Python).
+
+        Extra keyword arguments are passed to generate(). Returns one entry
+        per seed, in seed order: the WorldState, or None if that seed failed.
+        """
+        jobs = [(base_seed + i, width, height, generate_kwargs) for i in range(count)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_generate_world, jobs))
+
+
+def _generate_world(job: Tuple[int, int, int, Dict]) -> Optional[WorldState]:
+    """Worker for WorldGenerator.generate_batch (module-level so it pickles)"""
+    seed, width, height, generate_kwargs = job
+    gen = WorldGenerator(width=width, height=height, seed=seed)
+    if not gen.generate(**generate_kwargs):
+        return None
+    return gen.world
 
 
 # =============================================================================
@@ -885,9 +976,6 @@ def demo():
         print("\nPATH LENGTHS BETWEEN PLOT POINTS:")
         playable = gen.get_playable_order()
 
-        # Choose propp names based on plot type
-        propp_names = ADV_PROPP_NAMES if gen.world.advanced_plot else PROPP_NAMES
-
         for i in range(len(playable) - 1):
             from_id, from_node, from_pos = playable[i]
             to_id, to_node, to_pos = playable[i + 1]
@@ -896,8 +984,8 @@ def demo():
                 path = gen.geo_gen.find_path_between(
                     f"plot_{from_id}", f"plot_{to_id}"
                 )
-                from_name = propp_names.get(from_node.function, str(from_node.function))
-                to_name = propp_names.get(to_node.function, str(to_node.function))
+                from_name = from_node.name
+                to_name = to_node.name
                 if path:
                     print(f"  {from_name} -> {to_name}: {len(path)} steps")
                 else:
@@ -5,7 +5,7 @@ First-person horizon view with silhouettes of terrain features.
 Inspired by Mike Singleton's 1984 ZX Spectrum classic.
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from .geography import TileType
 
 # ASCII art sprites for each terrain type (3 distance levels: far, mid, near)
@@ -287,6 +287,49 @@ SPRITES = {
     },
 }
 
+
+def _sprite_runs(line: str) -> List[Tuple[int, bytes]]:
+    """Maximal non-space runs of a sprite line as (column, ASCII bytes)"""
+    runs = []
+    start = None
+    for j, char in enumerate(line + ' '):
+        if char != ' ' and start is None:
+            start = j
+        elif char == ' ' and start is not None:
+            runs.append((start, line[start:j].encode('ascii')))
+            start = None
+    return runs
+
+
+# Distance bands, far to near; a band's index is its slot in SPRITE_TABLE
+# and also how many rows below the horizon a sprite's base sits (far
+# sprites rest on the horizon, nearer ones overlap the ground)
+DISTANCE_NAMES = ('far', 'mid', 'near')
+DISTANCE_INDEX = {name: i for i, name in enumerate(DISTANCE_NAMES)}
+
+
+def _build_sprite_table() -> List[Optional[Tuple[list, int, int]]]:
+    """Flatten SPRITES into the SPRITE_TABLE layout"""
+    table = [None] * (len(TileType) * len(DISTANCE_NAMES))
+    for tile, by_distance in SPRITES.items():
+        for distance, lines in by_distance.items():
+            if lines:
+                band = DISTANCE_INDEX[distance]
+                table[tile * 3 + band] = (
+                    [(len(line), _sprite_runs(line)) for line in reversed(lines)],
+                    band - len(lines),
+                    hash(str(tile) + distance) % 7 - 3,
+                )
+    return table
+
+
+# Sprites ready to blit, at index tile id * 3 + band (None = no sprite):
+# (rows, y offset, x offset). rows holds one (line width, runs) per line,
+# top to bottom; spaces are transparent so only the runs are copied. The
+# y offset is from the horizon row; the x offset is the per-sprite jitter
+# from the view centre.
+SPRITE_TABLE = _build_sprite_table()
+
 # Direction names
 DIRECTIONS = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
 DIRECTION_OFFSETS = {
@@ -295,6 +338,49 @@ DIRECTION_OFFSETS = {
 }
 
 
+def _visibility_offsets(dx: int, dy: int) -> List[Tuple[int, int, int]]:
+    """
+    Cells seen looking along (dx, dy), as (offset x, offset y, band index)
+    in drawing-list order: straight ahead at 1-3 steps, plus the two
+    side cells at steps 1-2, which appear one distance band further.
+    """
+    if dx == 0:
+        perp = [(1, 0), (-1, 0)]
+    elif dy == 0:
+        perp = [(0, 1), (0, -1)]
+    else:
+        perp = [(-dy, dx), (dy, -dx)]
+
+    offsets = []
+    for dist, band, side_band in ((1, 2, 1), (2, 1, 0), (3, 0, None)):
+        ox, oy = dx * dist, dy * dist
+        offsets.append((ox, oy, band))
+        if side_band is not None:
+            offsets.extend((ox + px, oy + py, side_band) for px, py in perp)
+    return offsets
+
+
+# Visible cell offsets per direction (unknown directions look north)
+VISIBILITY_OFFSETS = {
+    direction: _visibility_offsets(dx, dy)
+    for direction, (dx, dy) in DIRECTION_OFFSETS.items()
+}
+
+# TileType members indexed by raw tile id
+TILE_TYPES = tuple(TileType)
+
+# Ground texture under the viewer, indexed by raw tile id (default ',')
+GROUND_CHAR_BY_TILE = {
+    TileType.FOREST: '"',
+    TileType.ROAD: '.',
+    TileType.CLEARING: ',',
+    TileType.SWAMP: '%',
+    TileType.RIVER: '~',
+    TileType.BRIDGE: '=',
+}
+GROUND_CHARS = ''.join(GROUND_CHAR_BY_TILE.get(t, ',') for t in TileType)
+
+
 class LandscapeRenderer:
     """
     Renders Lords of Midnight-style first-person landscape view.
@@ -304,6 +390,10 @@ class LandscapeRenderer:
         self.width = width
         self.height = height
 
+        # Drawn canvas lines by (visible cells, ground char, width, height);
+        # many positions share a view, so each scene is blitted once
+        self._scene_cache: Dict[Tuple, List[str]] = {}
+
     def get_visible_tiles(self, grid: List[List[int]],
                           x: int, y: int,
                           direction: str) -> List[Tuple[TileType, str]]:
@@ -312,41 +402,23 @@ class LandscapeRenderer:
         Returns list of (tile_type, distance) tuples.
         distance is 'near', 'mid', or 'far'
         """
-        dx, dy = DIRECTION_OFFSETS.get(direction, (0, -1))
+        return [(TILE_TYPES[tile], DISTANCE_NAMES[band])
+                for tile, band in self._visible_cells(grid, x, y, direction)]
+
+    def _visible_cells(self, grid: List[List[int]],
+                       x: int, y: int,
+                       direction: str) -> List[Tuple[int, int]]:
+        """get_visible_tiles() as (raw tile id, band index), for render()"""
+        offsets = VISIBILITY_OFFSETS.get(direction) or VISIBILITY_OFFSETS['N']
 
         height = len(grid)
         width = len(grid[0]) if height > 0 else 0
 
         visible = []
-
-        # Look ahead in 3 distance bands
-        for dist, dist_name in [(1, 'near'), (2, 'mid'), (3, 'far')]:
-            nx = x + dx * dist
-            ny = y + dy * dist
-
-            if 0 <= nx < width and 0 <= ny < height:
-                tile = TileType(grid[ny][nx])
-                visible.append((tile, dist_name))
-
-            # Also check sides at each distance
-            if dist <= 2:
-                # Perpendicular offsets
-                if dx == 0:
-                    perp = [(1, 0), (-1, 0)]
-                elif dy == 0:
-                    perp = [(0, 1), (0, -1)]
-                else:
-                    perp = [(-dy, dx), (dy, -dx)]
-
-                for px, py in perp:
-                    sx = nx + px
-                    sy = ny + py
-                    if 0 <= sx < width and 0 <= sy < height:
-                        tile = TileType(grid[sy][sx])
-                        # Side tiles appear one distance band further
-                        side_dist = 'far' if dist_name == 'mid' else 'mid' if dist_name == 'near' else 'far'
-                        visible.append((tile, side_dist))
-
+        for ox, oy, band in offsets:
+            tx, ty = x + ox, y + oy
+            if 0 <= tx < width and 0 <= ty < height:
+                visible.append((grid[ty][tx], band))
         return visible
 
     def render(self, grid: List[List[int]],
@@ -363,69 +435,19 @@ class LandscapeRenderer:
         lines.append(" " * self.width)
 
         # Get visible tiles
-        visible = self.get_visible_tiles(grid, x, y, direction)
-
-        # Create canvas
-        canvas = [[' ' for _ in range(self.width)] for _ in range(self.height - 4)]
-
-        # Horizon line
-        horizon_y = 2
-        for i in range(self.width):
-            canvas[horizon_y][i] = '-'
-
-        # Draw sprites (far to near, so near overwrites far)
-        for tile, distance in reversed(visible):
-            sprite_data = SPRITES.get(tile, {}).get(distance, [])
-            if not sprite_data:
-                continue
-
-            # Position sprite
-            if distance == 'far':
-                start_y = horizon_y - len(sprite_data)
-                center_x = self.width // 2
-                scale = 0.7
-            elif distance == 'mid':
-                start_y = horizon_y - len(sprite_data) + 1
-                center_x = self.width // 2
-                scale = 0.85
-            else:  # near
-                start_y = horizon_y - len(sprite_data) + 2
-                center_x = self.width // 2
-                scale = 1.0
-
-            # Add some horizontal offset for variety
-            offset = hash(str(tile) + distance) % 7 - 3
-            center_x += offset
-
-            # Draw sprite
-            for i, line in enumerate(reversed(sprite_data)):
-                y_pos = start_y + i
-                if 0 <= y_pos < len(canvas):
-                    x_start = center_x - len(line) // 2
-                    for j, char in enumerate(line):
-                        x_pos = x_start + j
-                        if 0 <= x_pos < self.width and char != ' ':
-                            canvas[y_pos][x_pos] = char
+        visible = self._visible_cells(grid, x, y, direction)
 
         # Ground texture
-        current_tile = TileType(grid[y][x]) if 0 <= y < len(grid) and 0 <= x < len(grid[0]) else TileType.CLEARING
-        ground_char = {
-            TileType.FOREST: '"',
-            TileType.ROAD: '.',
-            TileType.CLEARING: ',',
-            TileType.SWAMP: '%',
-            TileType.RIVER: '~',
-            TileType.BRIDGE: '=',
-        }.get(current_tile, ',')
-
-        for y_pos in range(horizon_y + 1, len(canvas)):
-            for x_pos in range(self.width):
-                if canvas[y_pos][x_pos] == ' ':
-                    canvas[y_pos][x_pos] = ground_char
+        if 0 <= y < len(grid) and 0 <= x < len(grid[0]):
+            ground_char = GROUND_CHARS[grid[y][x]]
+        else:
+            ground_char = GROUND_CHARS[TileType.CLEARING]
 
-        # Convert canvas to lines
-        for row in canvas:
-            lines.append(''.join(row))
+        key = (tuple(visible), ground_char, self.width, self.height)
+        scene = self._scene_cache.get(key)
+        if scene is None:
+            scene = self._scene_cache[key] = self._draw_scene(visible, ground_char)
+        lines.extend(scene)
 
         # Status line
         lines.append("=" * self.width)
@@ -438,6 +460,49 @@ class LandscapeRenderer:
 
         return '\n'.join(lines)
 
+    def _draw_scene(self, visible: List[Tuple[int, int]],
+                    ground_char: str) -> List[str]:
+        """Canvas lines (horizon, sprites, ground) for a set of visible cells"""
+        # Create canvas: one flat ASCII buffer, row-major
+        width = self.width
+        canvas_h = self.height - 4
+        canvas = bytearray(b' ' * (width * canvas_h))
+
+        # Horizon line
+        horizon_y = 2
+        canvas[horizon_y * width:(horizon_y + 1) * width] = b'-' * width
+
+        # Draw sprites (far to near, so near overwrites far)
+        for tile, band in reversed(visible):
+            meta = SPRITE_TABLE[tile * 3 + band]
+            if meta is None:
+                continue
+
+            # Position sprite (offsets precomputed per tile and distance)
+            sprite_rows, y_offset, x_offset = meta
+            start_y = horizon_y + y_offset
+            center_x = width // 2 + x_offset
+
+            # Draw sprite, copying its non-space runs clipped to the canvas
+            for i, (line_len, runs) in enumerate(sprite_rows):
+                y_pos = start_y + i
+                if 0 <= y_pos < canvas_h:
+                    row = y_pos * width
+                    x_start = center_x - line_len // 2
+                    for j, run in runs:
+                        x0 = x_start + j
+                        lo, hi = max(0, -x0), min(len(run), width - x0)
+                        if lo < hi:
+                            canvas[row + x0 + lo:row + x0 + hi] = run[lo:hi]
+
+        # Ground texture fills the blank cells below the horizon
+        ground = (horizon_y + 1) * width
+        canvas[ground:] = canvas[ground:].replace(b' ', ground_char.encode('ascii'))
+
+        # Convert canvas to lines
+        text = canvas.decode('ascii')
+        return [text[i:i + width] for i in range(0, len(text), width)]
+
     def render_compass(self, direction: str) -> str:
         """Render a simple compass"""
         dirs = ['N', 'E', 'S', 'W']
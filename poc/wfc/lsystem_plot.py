@@ -12,7 +12,10 @@ This is Z80-friendly: rules fit in ~100 bytes, expansion is deterministic.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Set
+from bisect import bisect_left
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional, Set
 from enum import IntEnum
 import struct
 
@@ -63,6 +66,16 @@ CONTAINER_SYMBOLS = {
     'X': 'BRANCH',           # Branching point
 }
 
+# Terminal stand-ins for non-terminals left at max depth (any other
+# uppercase letter becomes 't'), as a str.translate table
+FORCE_TERMINALS = {
+    'S': 'sw', 'A': 'ds', 'C': 'gt', 'Q': 'ta',
+    'T': 'n', 'F': 'w', 'X': 's', 'E': 'wh', 'B': 't'
+}
+FORCE_TERMINAL_TABLE = str.maketrans({
+    c: FORCE_TERMINALS.get(c, 't') for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+})
+
 
 # =============================================================================
 # GRAMMAR RULES (The Narrative DNA)
@@ -179,27 +192,37 @@ class LSystemExpander:
 
     Deterministic: same seed always produces same result.
     Compact: rules fit in ~100 bytes.
+
+    rules is a read-only view (symbol -> tuple of (pattern, weight)),
+    shared by every expander of the same genre; expansion runs on
+    cumulative weights precomputed from it.
     """
 
+    # Effective rules per genre, and per symbol (patterns, cumulative
+    # weights) for _expand_walk; shared by all expanders (read-only)
+    _rules_cache: Dict[Optional[str], Mapping[str, Tuple[Tuple[str, float], ...]]] = {}
+    _rule_cum_cache: Dict[Optional[str], Dict[str, Tuple[List[str], List[float]]]] = {}
+
     def __init__(self, seed: int = 0, genre: str = None, max_depth: int = 6):
         self.seed = seed
         self.genre = genre
         self.max_depth = max_depth
         self.rng_state = seed
 
-        # Build effective rules with genre modifiers
-        self.rules = self._build_rules()
-
-    def _lcg_random(self) -> float:
-        """Linear Congruential Generator - Z80 compatible"""
-        # Classic LCG: state = (a * state + c) mod m
-        # These constants work well and fit in 16-bit math
-        self.rng_state = (self.rng_state * 1103515245 + 12345) & 0x7FFFFFFF
-        return (self.rng_state >> 16) / 32768.0
-
-    def _seed_for_symbol(self, symbol: str, depth: int, position: int):
-        """Create deterministic sub-seed for each expansion"""
-        self.rng_state = (self.seed + ord(symbol) * 256 + depth * 65536 + position) & 0x7FFFFFFF
+        # Build effective rules with genre modifiers (once per genre)
+        rules = self._rules_cache.get(genre)
+        if rules is None:
+            rules = self._rules_cache[genre] = MappingProxyType(
+                {symbol: tuple(options) for symbol, options in self._build_rules().items()})
+            self._rule_cum_cache[genre] = {
+                symbol: ([pattern for pattern, _ in options],
+                         list(accumulate(weight for _, weight in options)))
+                for symbol, options in rules.items()
+            }
+        self.rules = rules
+        self._rule_cum = self._rule_cum_cache[genre]
+        # (seed, max_depth, start) -> (expansion, final rng_state)
+        self._expansions: Dict[Tuple[int, int, str], Tuple[str, int]] = {}
 
     def _build_rules(self) -> Dict[str, List[Tuple[str, float]]]:
         """Build rules with genre modifications"""
@@ -217,74 +240,86 @@ class LSystemExpander:
 
         return rules
 
-    def _select_rule(self, symbol: str) -> str:
-        """Select expansion rule using weighted random"""
-        if symbol not in self.rules:
-            return symbol  # Terminal or unknown
-
-        options = self.rules[symbol]
-        total_weight = sum(w for _, w in options)
-
-        r = self._lcg_random() * total_weight
-        cumulative = 0.0
-
-        for pattern, weight in options:
-            cumulative += weight
-            if r <= cumulative:
-                return pattern
-
-        return options[0][0]  # Fallback
-
     def expand(self, start: str = 'S') -> str:
         """
         Expand from start symbol to full string.
 
         Returns string of terminals (lowercase Propp functions)
         with special markers for branches (|) and structure.
+        Repeated expansions of the same start symbol are memoized.
         """
-        return self._expand_recursive(start, 0, 0)
-
-    def _expand_recursive(self, symbols: str, depth: int, position: int) -> str:
-        """Recursively expand symbols"""
-        if depth > self.max_depth:
-            # Convert remaining non-terminals to simple patterns
-            return self._force_terminal(symbols)
-
-        result = []
-        pos = 0
-
-        for i, char in enumerate(symbols):
-            if char == '|':
-                # Branch marker - keep it
-                result.append('|')
-            elif char.isupper():
-                # Non-terminal - expand
-                self._seed_for_symbol(char, depth, position + pos)
-                expansion = self._select_rule(char)
-                expanded = self._expand_recursive(expansion, depth + 1, position + pos)
-                result.append(expanded)
-                pos += len(expanded)
-            else:
-                # Terminal - keep it
-                result.append(char)
-                pos += 1
+        key = (self.seed, self.max_depth, start)
+        cached = self._expansions.get(key)
+        if cached is not None:
+            expanded, self.rng_state = cached
+            return expanded
+
+        expanded = self._expand_walk(start)
+        if expanded != start:
+            # All-terminal starts leave rng_state untouched; not cached
+            self._expansions[key] = (expanded, self.rng_state)
+        return expanded
+
+    def _expand_walk(self, start: str) -> str:
+        """Expand symbols depth-first with an explicit stack.
+
+        Each frame is (symbols, next index, depth, shift), where shift is
+        the frame's expansion position minus the output length, so the
+        position of the next symbol is always len(out) + shift. Branch
+        markers take no position, so they decrement the shift.
+        """
+        max_depth = self.max_depth
+        seed = self.seed
+        rule_cum = self._rule_cum
+        rng = self.rng_state
+        out: List[str] = []
+        out_len = 0
+        stack: List[Tuple[str, int, int, int]] = [(start, 0, 0, 0)]
+
+        while stack:
+            symbols, i, depth, shift = stack.pop()
+            if depth > max_depth:
+                # Convert remaining non-terminals to simple patterns
+                forced = self._force_terminal(symbols)
+                out.append(forced)
+                out_len += len(forced)
+                continue
 
-        return ''.join(result)
+            for i in range(i, len(symbols)):
+                char = symbols[i]
+                if char == '|':
+                    # Branch marker - keep it
+                    out.append('|')
+                    out_len += 1
+                    shift -= 1
+                elif char.isupper():
+                    # Non-terminal - deterministic sub-seed per expansion
+                    rng = (seed + ord(char) * 256 + depth * 65536
+                           + out_len + shift) & 0x7FFFFFFF
+                    entry = rule_cum.get(char)
+                    if entry is None:
+                        expansion = char  # Terminal or unknown
+                    else:
+                        # Z80-compatible LCG: state = (a * state + c) mod m;
+                        # first pattern whose cumulative weight reaches r
+                        rng = (rng * 1103515245 + 12345) & 0x7FFFFFFF
+                        patterns, cumulative = entry
+                        j = bisect_left(cumulative, (rng >> 16) / 32768.0 * cumulative[-1])
+                        expansion = patterns[j] if j < len(patterns) else patterns[0]
+                    stack.append((symbols, i + 1, depth, shift))
+                    stack.append((expansion, 0, depth + 1, shift))
+                    break
+                else:
+                    # Terminal - keep it
+                    out.append(char)
+                    out_len += 1
+
+        self.rng_state = rng
+        return ''.join(out)
 
     def _force_terminal(self, symbols: str) -> str:
         """Force non-terminals to become terminals"""
-        result = []
-        for char in symbols:
-            if char.isupper():
-                # Map to default terminal pattern
-                defaults = {
-                    'S': 'sw', 'A': 'ds', 'C': 'gt', 'Q': 'ta',
-                    'T': 'n', 'F': 'w', 'X': 's', 'E': 'wh', 'B': 't'
-                }
-                result.append(defaults.get(char, 't'))
-            else:
-                result.append(char)
-        return ''.join(result)
+        return symbols.translate(FORCE_TERMINAL_TABLE)
 
     def to_propp_sequence(self, expanded: str = None) -> List[str]:
         """Convert expanded string to Propp function sequence"""
@@ -296,16 +331,11 @@ class LSystemExpander:
 
         if len(branches) == 1:
             # Linear
-            for char in expanded:
-                if char in PROPP_ALPHABET:
-                    sequence.append(PROPP_ALPHABET[char])
+            sequence = [PROPP_ALPHABET[char] for char in expanded if char in PROPP_ALPHABET]
         else:
             # Has branches - return nested structure
             for branch in branches:
-                branch_seq = []
-                for char in branch:
-                    if char in PROPP_ALPHABET:
-                        branch_seq.append(PROPP_ALPHABET[char])
+                branch_seq = [PROPP_ALPHABET[char] for char in branch if char in PROPP_ALPHABET]
                 if branch_seq:
                     sequence.append(branch_seq)
 
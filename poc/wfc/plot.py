@@ -78,6 +78,7 @@ class PlotNode:
     description: str = ""
     location_hint: str = ""  # Where this should happen
     actor_hint: str = ""     # Who is involved
+    name: str = field(default="", repr=False, compare=False)  # PROPP_NAMES[function], set by add_node
 
     def __repr__(self):
         return f"PlotNode({PROPP_NAMES[self.function]}, req=0x{self.requires:02x}, prov=0x{self.provides:02x})"
@@ -179,16 +180,24 @@ class PlotGraph:
     edges: Dict[int, List[int]] = field(default_factory=dict)  # node_id -> [successor_ids]
     reverse_edges: Dict[int, List[int]] = field(default_factory=dict)  # node_id -> [predecessor_ids]
 
+    # Bumped by add_node/add_edge; topological_sort() caches per revision
+    revision: int = field(default=0, init=False, repr=False)
+    _topo_order: Optional[List[int]] = field(default=None, init=False, repr=False)
+    _topo_revision: int = field(default=-1, init=False, repr=False)
+
     def add_node(self, node: PlotNode) -> int:
         """Add node and return its ID"""
         node.id = len(self.nodes)
+        node.name = PROPP_NAMES[node.function]
         self.nodes.append(node)
         self.edges[node.id] = []
         self.reverse_edges[node.id] = []
+        self.revision += 1
         return node.id
 
     def add_edge(self, from_id: int, to_id: int):
         """Add edge: from_id must happen before to_id"""
+        self.revision += 1
         if to_id not in self.edges[from_id]:
             self.edges[from_id].append(to_id)
         if from_id not in self.reverse_edges[to_id]:
@@ -203,7 +212,18 @@ class PlotGraph:
         return [i for i, succs in self.edges.items() if not succs]
 
     def topological_sort(self) -> List[int]:
-        """Return one valid ordering (Kahn's algorithm)"""
+        """
+        Return one valid ordering (Kahn's algorithm).
+        The ordering is drawn once per graph revision and then shared
+        between callers, so treat it as read-only.
+        """
+        if self._topo_revision != self.revision:
+            self._topo_order = self._kahn_order()
+            self._topo_revision = self.revision
+        return self._topo_order
+
+    def _kahn_order(self) -> List[int]:
+        """One random valid ordering, [] if the graph has a cycle"""
         in_degree = {i: len(preds) for i, preds in self.reverse_edges.items()}
         queue = [i for i, d in in_degree.items() if d == 0]
         result = []
@@ -357,7 +377,7 @@ class BackwardPlotGenerator:
 
         for i, node_id in enumerate(order):
             node = self.graph.nodes[node_id]
-            lines.append(f"{i+1}. [{PROPP_NAMES[node.function]}] {node.description}")
+            lines.append(f"{i+1}. [{node.name}] {node.description}")
             lines.append(f"   Location: {node.location_hint}")
 
             # Show requirements
@@ -387,7 +407,7 @@ class BackwardPlotGenerator:
             loc = node.location_hint
             if loc not in locations:
                 locations[loc] = []
-            locations[loc].append(PROPP_NAMES[node.function])
+            locations[loc].append(node.name)
         return locations
 
     def verify_completability(self) -> Tuple[bool, str]:
@@ -411,7 +431,7 @@ class BackwardPlotGenerator:
             if (node.requires & state) != node.requires:
                 missing = node.requires & ~state
                 missing_names = [r.name for r in Requirement if r != Requirement.NONE and missing & r]
-                return False, f"Node {node_id} ({PROPP_NAMES[node.function]}) requires: {missing_names}"
+                return False, f"Node {node_id} ({node.name}) requires: {missing_names}"
 
             # Update state
             state |= node.provides
@@ -451,9 +471,9 @@ def demo():
             print("Graph edges (A -> B means A before B):")
             for from_id, to_ids in gen.graph.edges.items():
                 if to_ids:
-                    from_name = PROPP_NAMES[gen.graph.nodes[from_id].function]
+                    from_name = gen.graph.nodes[from_id].name
                     for to_id in to_ids:
-                        to_name = PROPP_NAMES[gen.graph.nodes[to_id].function]
+                        to_name = gen.graph.nodes[to_id].name
                         print(f"  {from_name} -> {to_name}")
             break
         else:
@@ -816,6 +816,9 @@ class PlotNode:
     invalidates: Set[int] = field(default_factory=set)  # Nodes this twist invalidates
     recontextualizes: Dict[int, str] = field(default_factory=dict)  # node_id -> new meaning
 
+    # PROPP_NAMES[function], filled in by MultiPlot.add_node
+    name: str = field(default="", repr=False, compare=False)
+
 
 # =============================================================================
 # Twist Templates
@@ -965,18 +968,37 @@ class MultiPlot:
     has_false_ending: bool = False
     false_ending_count: int = 0
 
+    # Bumped by add_node/add_edge; topological_sort() caches per revision
+    revision: int = field(default=0, init=False, repr=False)
+    _topo_order: Optional[List[int]] = field(default=None, init=False, repr=False)
+    _topo_revision: int = field(default=-1, init=False, repr=False)
+
     def add_node(self, node: PlotNode) -> int:
         node.id = len(self.nodes)
+        node.name = PROPP_NAMES[node.function]
         self.nodes.append(node)
         self.edges[node.id] = []
+        self.revision += 1
         return node.id
 
     def add_edge(self, from_id: int, to_id: int):
+        self.revision += 1
         if to_id not in self.edges[from_id]:
             self.edges[from_id].append(to_id)
 
     def topological_sort(self) -> List[int]:
-        """Return nodes in topological order (Kahn's algorithm)"""
+        """
+        Return nodes in topological order (Kahn's algorithm).
+        Computed once per plot revision and shared between callers, so
+        treat the list as read-only.
+        """
+        if self._topo_revision != self.revision:
+            self._topo_order = self._kahn_order()
+            self._topo_revision = self.revision
+        return self._topo_order
+
+    def _kahn_order(self) -> List[int]:
+        """Kahn's algorithm over nodes/edges, [] if there is a cycle"""
         # Compute in-degrees
         in_degree = {i: 0 for i in range(len(self.nodes))}
         for from_id, to_list in self.edges.items():
@@ -1001,6 +1023,14 @@ class MultiPlot:
             return []  # Cycle detected
         return result
 
+    def get_twist_nodes(self) -> List[PlotNode]:
+        """Nodes that carry a twist (twist_type other than NONE)"""
+        return [n for n in self.nodes if n.twist_type and n.twist_type != TwistType.NONE]
+
+    def get_false_ending_nodes(self) -> List[PlotNode]:
+        """Nodes marked as false endings"""
+        return [n for n in self.nodes if n.is_false_ending]
+
     def get_all_paths(self) -> List[List[int]]:
         """Get all possible paths through the plot"""
         paths = []
@@ -1805,8 +1835,8 @@ class AdvancedPlotGenerator:
                     self.plot.endings.append(node_id)
 
         # Store metadata - check nodes for twist/false endings
-        twist_nodes = [n for n in self.plot.nodes if n.twist_type and n.twist_type != TwistType.NONE]
-        false_ending_nodes = [n for n in self.plot.nodes if n.is_false_ending]
+        twist_nodes = self.plot.get_twist_nodes()
+        false_ending_nodes = self.plot.get_false_ending_nodes()
 
         if twist_nodes:
             self.plot.twist_type = twist_nodes[0].twist_type
@@ -1896,8 +1926,7 @@ class AdvancedPlotGenerator:
             if (node.requires & state) != node.requires:
                 missing = node.requires & ~state
                 missing_names = [r.name for r in Requirement if r != Requirement.NONE and missing & r]
-                func_name = PROPP_NAMES.get(node.function, str(node.function))
-                return False, f"Node {node_id} ({func_name}) requires: {missing_names}"
+                return False, f"Node {node_id} ({node.name}) requires: {missing_names}"
 
             # Update state
             state |= node.provides
@@ -14,6 +14,7 @@ Each plot point can contain a sub-plot, creating fractal structure.
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple, Set
 from enum import IntEnum, auto
+import json
 import random
 
 from .plot_advanced import (
@@ -353,7 +354,6 @@ class FractalPlot:
 
     def to_json(self, indent: int = 2) -> str:
         """Export plot to JSON string"""
-        import json
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
 
@@ -11,6 +11,8 @@ from typing import List, Dict, Tuple
 import random
 
 from .integration import WorldGenerator
+from .geography import GeographyGenerator, TileType
+from .cfg_renderer import CFGRenderer, PROPP_TEMPLATES, GENRE_SLOTS, Mood, Person
 from .plot import PROPP_NAMES
 
 
@@ -232,6 +234,88 @@ def visualize_sample_worlds(seeds: List[int], width: int = 20, height: int = 12)
             print()
 
 
+def test_local_repair_keeps_adjacency(num_seeds: int = 400):
+    """
+    Force WFC contradictions by collapsing random cells, repair them with
+    resolve_local and check every adjacent pair of the repaired map against
+    the constraint tables.
+    """
+    print("=== Testing local WFC repair ===\n")
+
+    tiles = list(TileType)
+    repaired = 0
+
+    for seed in range(num_seeds):
+        rng = random.Random(seed)
+        geo = GeographyGenerator(16, 12, seed=seed)
+        geo.place_anchor(1, 1, TileType.VILLAGE, "home")
+        geo.place_anchor(14, 10, TileType.CASTLE, "goal")
+        wfc = geo.wfc
+
+        # Collapse and propagate until some cell runs out of tiles
+        for _ in range(40):
+            if (wfc.collapse(rng.randrange(16), rng.randrange(12), rng.choice(tiles))
+                    and not wfc.propagate()):
+                break
+        else:
+            continue
+
+        cx, cy = geo.last_contradiction
+        radius = 1
+        while radius < 16 and not geo.resolve_local(cx, cy, radius):
+            radius *= 2
+        if radius >= 16:
+            continue
+        repaired += 1
+
+        grid = wfc.to_tile_grid()
+        for y, row in enumerate(grid):
+            for x, a in enumerate(row):
+                if x + 1 < len(row):
+                    b = row[x + 1]
+                    assert (wfc.constraints_e[a] >> b) & 1 and (wfc.constraints_w[b] >> a) & 1, \
+                        f"Seed {seed}: tiles {a},{b} not allowed side by side at ({x}, {y})"
+                if y + 1 < len(grid):
+                    b = grid[y + 1][x]
+                    assert (wfc.constraints_s[a] >> b) & 1 and (wfc.constraints_n[b] >> a) & 1, \
+                        f"Seed {seed}: tiles {a},{b} not allowed stacked at ({x}, {y})"
+
+    print(f"Repaired maps checked: {repaired}")
+    assert repaired > 0, "No contradiction was forced and repaired"
+    print("\nLocal repair: PASSED\n")
+
+
+def test_second_person_matches_post_pass(num_seeds: int = 4):
+    """
+    Second-person Propp renders must equal the third-person render (same
+    seed, so same template) passed through _to_second_person, for every
+    function, mood and genre, with default and custom hero pronouns.
+    """
+    print("=== Testing second-person rendering ===\n")
+
+    heroes = [{}, {'hero_name': 'Alice', 'hero_possessive': 'her', 'hero_object': 'her'}]
+    checked = 0
+
+    for function in PROPP_TEMPLATES:
+        for mood in Mood:
+            for genre in GENRE_SLOTS:
+                for seed in range(num_seeds):
+                    for hero in heroes:
+                        second = CFGRenderer(seed=seed, genre=genre)
+                        second.set_context(person=Person.SECOND, mood=mood, **hero)
+                        third = CFGRenderer(seed=seed, genre=genre)
+                        third.set_context(person=Person.THIRD, mood=mood, **hero)
+
+                        text = second.render_propp(function)
+                        expected = third._to_second_person(third.render_propp(function))
+                        assert text == expected, \
+                            f"{function}/{mood.name}/{genre}/{seed}: {text!r} != {expected!r}"
+                        checked += 1
+
+    print(f"Renders checked: {checked}")
+    print("\nSecond person: PASSED\n")
+
+
 # =============================================================================
 # Main
 # =============================================================================